@@ -0,0 +1,86 @@
+"""Streamlit helpers shared by stack_app.py and queue_app.py."""
+import streamlit as st
+
+from qbank import metrics
+from qbank.export import EXPORT_FORMATS, QuestionExport
+from qbank.pool import open_default_pools
+
+PAGE_SIZES = [10, 25, 50, 100]
+
+
+# One metrics endpoint / JSON dump per process when QBANK_METRICS_PORT or QBANK_METRICS_FILE is set.
+@st.cache_resource
+def start_metrics():
+    return metrics.start_from_env()
+
+
+# Ready-made questions for every selection of one bank, shared by all sessions and refilled
+# in the background, so a submit pops questions instead of generating them.
+@st.cache_resource
+def get_question_pools(bank):
+    pools = open_default_pools()
+    pools.warm(bank)
+    return pools
+
+
+def init_question_state():
+    if "all_questions" not in st.session_state:
+        st.session_state.all_questions = []
+    if "export" not in st.session_state:
+        st.session_state.export = QuestionExport()
+
+
+def add_questions(new_questions):
+    st.session_state.all_questions.extend(new_questions)
+    # Serialize only the new questions; earlier ones are already in the export spool.
+    st.session_state.export.append(new_questions)
+
+
+def clear_questions():
+    st.session_state.export.close()
+    st.session_state.export = QuestionExport()
+    st.session_state.all_questions = []
+
+
+def page_bounds(total, page, page_size):
+    """Return the [start, end) slice of questions shown on a 1-based page."""
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total)
+
+
+def question_page(total, key="questions"):
+    """Draw the page-size, page and jump-to controls; return the slice to render.
+
+    Only the returned slice is rendered, so a rerun costs O(page size) no matter
+    how many questions the session holds.
+    """
+    size_key, page_key, jump_key = f"{key}_page_size", f"{key}_page", f"{key}_jump"
+
+    def jump_to_question():
+        number = st.session_state[jump_key]
+        if number:
+            st.session_state[page_key] = (number - 1) // st.session_state[size_key] + 1
+
+    size_col, page_col, jump_col = st.columns(3)
+    page_size = size_col.selectbox("Questions per page", PAGE_SIZES, key=size_key)
+    pages = max(1, -(-total // page_size))
+    # Clamp a stale page number (e.g. after a smaller page size or Clear All) before drawing the widget.
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = page_col.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=page_key)
+    jump_col.number_input("Jump to question", min_value=0, max_value=total, step=1, key=jump_key,
+                          on_change=jump_to_question, help="0 keeps the current page")
+    return page_bounds(total, page, page_size)
+
+
+def export_controls(export, key="export"):
+    """Offer the session's questions for download, assembling the payload only on request."""
+    ready_key = f"{key}_ready"
+    format_col, button_col = st.columns(2)
+    fmt = format_col.selectbox("Download format", list(EXPORT_FORMATS), key=f"{key}_format")
+    if button_col.button("Prepare download", key=f"{key}_prepare"):
+        st.session_state[ready_key] = (len(export), fmt)
+    # The prepared payload goes stale as soon as new questions arrive or the format changes.
+    if st.session_state.get(ready_key) == (len(export), fmt):
+        file_name, mime = EXPORT_FORMATS[fmt]
+        st.download_button(f"📥 Download Questions ({fmt})", data=export.payload(fmt), file_name=file_name, mime=mime)
@@ -0,0 +1,231 @@
+"""Throughput, latency and peak-memory benchmarks for every question generator.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_generators -o bench.json
+    python -m benchmarks.bench_generators --baseline bench.json
+
+Each case times one generator call at a time and reports questions per second, the
+p50/p99 latency of a call and the peak traced memory of holding a full run's output.
+Explainer cases time rendering the deferred explanation text of pre-generated questions.
+With ``--baseline`` the run is compared case by case against an earlier JSON report and
+the exit status is 1 if any metric is worse by more than ``--tolerance`` (p99 latency,
+the noisiest metric, gets four times as much slack).
+"""
+import argparse
+import gc
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from qbank import queues, stacks
+from qbank.explain import Explanation
+from qbank.expressions import expression_cache, generate_expression_question, iter_expression_questions
+
+DEFAULT_ITERATIONS = 2000
+DEFAULT_REPEAT = 3
+DEFAULT_TOLERANCE = 0.25
+# Tail latency is the noisiest metric, so it gets this multiple of the tolerance.
+P99_TOLERANCE_FACTOR = 4
+# Metrics compared against a baseline, and whether a larger value is better.
+COMPARED_METRICS = {"qps": True, "p50_us": False, "p99_us": False, "peak_kib": False}
+
+
+# ----- CASES -----
+# A case is ``(name, make_call)``; ``make_call(rng)`` returns a zero-argument function that
+# performs one unit of work and returns the list of questions (or explanations) it produced.
+def generator_case(name, fn, *args):
+    return name, lambda rng: (lambda: fn(*args, rng=rng))
+
+def single_question_case(name, fn, *args, **kwargs):
+    return name, lambda rng: (lambda: [fn(*args, rng=rng, **kwargs)])
+
+def explainer_case(name, make_questions):
+    """Renders one explanation per call, cycling over a pool of pre-generated questions.
+
+    The render function is called directly, so the cached text of an earlier pass over
+    the pool is never reused.
+    """
+    def make_call(rng):
+        pool = [
+            (q["explanation"].render_fn, q["explanation"].args)
+            for q in make_questions(rng) if isinstance(q["explanation"], Explanation)
+        ]
+        records = itertools.cycle(pool)
+
+        def call():
+            render_fn, args = next(records)
+            return [render_fn(*args)]
+        return call
+    return name, make_call
+
+def build_cases():
+    cases = [
+        generator_case("stack.template", stacks.generate_template_questions, "Operations", "Level 2", 1),
+        generator_case("stack.mcq", stacks.generate_mcq_questions, "Operations", 1),
+        generator_case("queue.template", queues.generate_template_questions, "Queue Applications", "Level 2", 1),
+        generator_case("queue.mcq", queues.generate_mcq_questions, "Queue Applications", 1),
+        # One expression call yields three questions (postfix value, prefix and postfix forms).
+        ("stack.expression", lambda rng: (lambda: generate_expression_question(rng))),
+    ]
+    for level in stacks.levels:
+        cases.append(generator_case(
+            f"stack.code_tracing.{level[-1]}", stacks.generate_code_tracing_questions, "Code Tracing", level, 1
+        ))
+    for q_type in queues.numerical_question_types:
+        cases.append(single_question_case(
+            f"queue.numerical.{q_type}", queues.queue_numerical_question, "Level 2", q_type=q_type
+        ))
+
+    cases.append(explainer_case(
+        "explain.expression", lambda rng: list(iter_expression_questions(100, rng))
+    ))
+    for level in stacks.levels:
+        cases.append(explainer_case(
+            f"explain.code_tracing.{level[-1]}",
+            lambda rng, level=level: stacks.generate_code_tracing_questions("Code Tracing", level, 300, rng=rng),
+        ))
+    for q_type in queues.numerical_question_types:
+        cases.append(explainer_case(
+            f"explain.numerical.{q_type}",
+            lambda rng, q_type=q_type: [queues.queue_numerical_question("Level 2", rng, q_type) for _ in range(100)],
+        ))
+    return cases
+
+
+# ----- MEASUREMENT -----
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+def time_case(make_call, iterations, seed):
+    # Every run replays the same seed, so a warm expression cache would turn repeats into hits.
+    expression_cache.clear()
+    call = make_call(random.Random(seed))
+    call()  # warm-up: first-call imports and caches
+    latencies = []
+    produced = 0
+    clock = time.perf_counter_ns
+    gc.collect()
+    for _ in range(iterations):
+        start = clock()
+        produced += len(call())
+        latencies.append(clock() - start)
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "calls": iterations,
+        "questions": produced,
+        "qps": round(produced / (total / 1e9), 1) if total else 0.0,
+        "p50_us": round(percentile(latencies, 0.50) / 1e3, 2),
+        "p99_us": round(percentile(latencies, 0.99) / 1e3, 2),
+    }
+
+def peak_memory_kib(make_call, iterations, seed):
+    """Peak traced memory while running and holding ``iterations`` calls' output."""
+    expression_cache.clear()
+    call = make_call(random.Random(seed))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        kept = [call() for _ in range(iterations)]
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return round(peak / 1024, 1)
+
+def best_of(runs):
+    """Best value of each metric over repeated runs, which filters out scheduler noise."""
+    best = dict(runs[0])
+    for run in runs[1:]:
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            if metric in run:
+                best[metric] = (max if higher_is_better else min)(best[metric], run[metric])
+    return best
+
+def run_benchmarks(cases, iterations, seed, repeat=DEFAULT_REPEAT):
+    results = {}
+    for name, make_call in cases:
+        result = best_of([time_case(make_call, iterations, seed) for _ in range(repeat)])
+        result["peak_kib"] = peak_memory_kib(make_call, iterations, seed)
+        results[name] = result
+        print(f"{name:36} {result['qps']:>12,.0f} q/s  p50 {result['p50_us']:>9.1f}us  "
+              f"p99 {result['p99_us']:>9.1f}us  peak {result['peak_kib']:>10,.1f} KiB", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+            "repeat": repeat,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+# ----- BASELINE COMPARISON -----
+def compare(report, baseline, tolerance):
+    """Return one message per metric that is worse than the baseline by more than ``tolerance``."""
+    regressions = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            allowed = tolerance * P99_TOLERANCE_FACTOR if metric == "p99_us" else tolerance
+            if (-change if higher_is_better else change) > allowed:
+                regressions.append(f"{name}: {metric} {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_generators", description=__doc__.split("\n")[0])
+    parser.add_argument("-n", "--iterations", type=int, default=DEFAULT_ITERATIONS,
+                        help=f"timed calls per case (default: {DEFAULT_ITERATIONS})")
+    parser.add_argument("-r", "--repeat", type=int, default=DEFAULT_REPEAT,
+                        help=f"timed runs per case; the best of each metric is kept (default: {DEFAULT_REPEAT})")
+    parser.add_argument("--seed", type=int, default=1, help="seed for every case (default: 1)")
+    parser.add_argument("-k", "--filter", default="", help="only run cases whose name contains this text")
+    parser.add_argument("-o", "--output", default=None, help="write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", default=None, help="JSON report of an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed relative regression per metric (default: {DEFAULT_TOLERANCE})")
+    args = parser.parse_args(argv)
+    if args.iterations < 1 or args.repeat < 1:
+        parser.error("--iterations and --repeat must be at least 1")
+
+    cases = [case for case in build_cases() if args.filter in case[0]]
+    if not cases:
+        parser.error(f"no benchmark case matches {args.filter!r}")
+    report = run_benchmarks(cases, args.iterations, args.seed, args.repeat)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as out:
+            out.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} against {args.baseline}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Headless stack and queue question generators.
+
+The Streamlit apps (``stack_app.py`` and ``queue_app.py``) are thin front ends
+over this package; batch jobs can import it without pulling in Streamlit.
+"""
+from . import queues, stacks
+from .expressions import generate_expression_question
+from .queues import generate_queue_numerical_questions
+from .dedup import DedupStore
+from .errors import CapacityError
+from .stacks import generate_code_tracing_questions
+
+# Each bank module exposes subtopics, levels, question_types, generate_questions(),
+# iter_questions(), questions_per_count(), generation_inputs() and distinct_questions().
+BANKS = {
+    "stack": stacks,
+    "queue": queues,
+}
+
+
+def generate(bank, subtopic, level, question_type, count, used_questions=None, seed=None):
+    return BANKS[bank].generate_questions(subtopic, level, question_type, count, used_questions, seed)
+
+
+def iter_generate(bank, subtopic, level, question_type, count, used_questions=None, seed=None):
+    return BANKS[bank].iter_questions(subtopic, level, question_type, count, used_questions, seed)
+
+
+__all__ = [
+    "BANKS",
+    "CapacityError",
+    "DedupStore",
+    "generate",
+    "generate_code_tracing_questions",
+    "generate_expression_question",
+    "generate_queue_numerical_questions",
+    "iter_generate",
+    "queues",
+    "stacks",
+]
@@ -0,0 +1,126 @@
+"""Command-line bulk generation: streams questions as newline-delimited JSON.
+
+Example::
+
+    python -m qbank --bank stack --subtopic "Code Tracing" --level "Level 3" \
+        --count 100000 --seed 7 -o tracing.jsonl
+"""
+import argparse
+import gzip
+import sys
+
+from . import BANKS, metrics
+from .parallel import iter_parallel_lines
+from .dedup import DedupStore
+from .errors import CapacityError
+from .export import dumps_question
+from .sandbox import SnippetRunner
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m qbank",
+        description="Generate stack/queue questions and write them as JSON Lines.",
+    )
+    parser.add_argument("--bank", choices=sorted(BANKS), default="stack", help="question bank (default: stack)")
+    parser.add_argument("--subtopic", required=True, help="subtopic name, e.g. 'Code Tracing'")
+    parser.add_argument("--level", default="Level 1", help="difficulty level (default: Level 1)")
+    parser.add_argument("--type", dest="question_type", default="Long Answer",
+                        help="question type (default: Long Answer); ignored for numerical subtopics")
+    parser.add_argument("--count", type=int, default=10, help="number of questions to request (default: 10)")
+    parser.add_argument("--seed", type=int, default=None, help="seed for reproducible output")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (default: 1); the output for a --seed is the same for any worker count")
+    parser.add_argument("--dedup-db", default=None,
+                        help="SQLite file of already issued questions; shared across runs and processes. Long-answer "
+                             "template questions then run unsharded, so nothing is claimed unless the run can finish")
+    parser.add_argument("--verify-code", action="store_true",
+                        help="run each Code Tracing snippet in a sandboxed worker pool and drop any whose output "
+                             "differs from its answer; runs unsharded, so its --seed output differs from a run "
+                             "without --verify-code")
+    parser.add_argument("--questions-only", action="store_true",
+                        help="omit answers and explanations (explanations are then never rendered)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="output file, '-' for stdout (default); a .gz suffix writes gzip-compressed JSONL")
+    return parser
+
+
+def validate_args(parser, args):
+    bank = BANKS[args.bank]
+    if args.subtopic not in bank.subtopics:
+        parser.error(f"unknown subtopic {args.subtopic!r} for bank {args.bank!r}; choose from {bank.subtopics}")
+    if args.level not in bank.levels:
+        parser.error(f"unknown level {args.level!r}; choose from {bank.levels}")
+    if args.question_type not in bank.question_types:
+        parser.error(f"unknown question type {args.question_type!r}; choose from {bank.question_types}")
+    if args.count < 0:
+        parser.error("--count must be non-negative")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.verify_code:
+        if args.bank != "stack" or args.subtopic != "Code Tracing":
+            parser.error("--verify-code only applies to --bank stack --subtopic 'Code Tracing'")
+        if args.workers > 1:
+            parser.error("--verify-code runs its own worker pool; use it with --workers 1")
+
+
+def write_lines(lines, out):
+    written = 0
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+        written += 1
+    return written
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    validate_args(parser, args)
+
+    # QBANK_METRICS_PORT / QBANK_METRICS_FILE expose metrics while the run is in progress.
+    metrics_server, metrics_dumper = metrics.start_from_env()
+    store = DedupStore(args.dedup_db) if args.dedup_db else None
+    verifier = SnippetRunner() if args.verify_code else None
+    bank = BANKS[args.bank]
+    # Shards draw independent random subsets, so a nearly exhausted template space would
+    # make them give up; one permutation walk over the space checks capacity before claiming.
+    walk_space = store is not None and bank.distinct_questions(args.subtopic, args.level, args.question_type) is not None
+    if verifier is not None or walk_space:
+        extra = {"verifier": verifier} if verifier is not None else {}
+        questions = bank.iter_questions(
+            args.subtopic, args.level, args.question_type, args.count, store, args.seed, **extra
+        )
+        lines = (dumps_question(q, args.questions_only) for q in questions)
+    else:
+        # Every worker count goes through the same shards, so a seed gives byte-identical output.
+        # The workers serialize their shards; this process only claims and writes lines.
+        lines = iter_parallel_lines(
+            args.bank, args.subtopic, args.level, args.question_type, args.count,
+            seed=args.seed, workers=args.workers, used_questions=store, questions_only=args.questions_only,
+        )
+    try:
+        if args.output == "-":
+            write_lines(lines, sys.stdout)
+            sys.stdout.flush()
+        else:
+            opener = gzip.open if args.output.endswith(".gz") else open
+            with opener(args.output, "wt", encoding="utf-8") as out:
+                write_lines(lines, out)
+    except CapacityError as exc:
+        print(f"{parser.prog}: error: {exc}", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        # Downstream closed early (e.g. piped into `head`); exit quietly.
+        sys.stderr.close()
+        return 1
+    finally:
+        if store is not None:
+            store.close()
+        if verifier is not None:
+            verifier.close()
+        if metrics_dumper is not None:
+            metrics_dumper.stop()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+    return 0
@@ -0,0 +1,129 @@
+"""Persistent "never issue the same question twice" index.
+
+:class:`DedupStore` keeps a 16-byte BLAKE2b digest of every issued question in
+an SQLite table keyed on the digest, so it survives restarts and is shared by
+every process pointed at the same file.  It is a drop-in replacement for the
+``used_questions`` sets the generators accept: ``in``/``add`` work one key at a
+time, and :meth:`DedupStore.claim_many` checks and records a whole batch in one
+transaction.
+"""
+import hashlib
+import itertools
+import os
+import sqlite3
+import threading
+
+from . import metrics
+from .errors import CapacityError
+
+DEDUP_DB_ENV = "QBANK_DEDUP_DB"
+# Questions are checked and recorded in batches of at most this many.
+CLAIM_BATCH = 512
+
+
+def question_digest(key):
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+class DedupStore:
+    def __init__(self, path, timeout=30.0):
+        self.path = path
+        # Streamlit serves sessions from several threads; one lock guards the connection.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS issued (digest BLOB PRIMARY KEY) WITHOUT ROWID")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM issued").fetchone()[0]
+
+    def __contains__(self, key):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM issued WHERE digest = ?", (question_digest(key),)).fetchone()
+        return row is not None
+
+    def add(self, key):
+        self.claim_many([key])
+
+    def claim_many(self, keys):
+        """Record every unseen key; return one bool per key, True where it was new.
+
+        The batch runs in a single write transaction, so two processes claiming
+        the same question concurrently cannot both see it as new.
+        """
+        fresh = []
+        with self._lock:
+            cur = self._conn.cursor()
+            cur.execute("BEGIN IMMEDIATE")
+            try:
+                for key in keys:
+                    cur.execute("INSERT OR IGNORE INTO issued (digest) VALUES (?)", (question_digest(key),))
+                    fresh.append(cur.rowcount == 1)
+                cur.execute("COMMIT")
+            except BaseException:
+                cur.execute("ROLLBACK")
+                raise
+        return fresh
+
+
+def open_default_store():
+    path = os.environ.get(DEDUP_DB_ENV)
+    return DedupStore(path) if path else None
+
+
+# ----- HELPERS FOR GENERATORS -----
+def claim_unseen(used_questions, keys):
+    claim_many = getattr(used_questions, "claim_many", None)
+    if claim_many is not None:
+        fresh = claim_many(keys)
+    else:
+        fresh = []
+        for key in keys:
+            is_new = key not in used_questions
+            if is_new:
+                used_questions.add(key)
+            fresh.append(is_new)
+    if metrics.enabled:
+        # The duplicate-rejection rate is rejected / candidates.
+        metrics.inc("qbank_dedup_candidates_total", len(fresh))
+        metrics.inc("qbank_dedup_rejected_total", len(fresh) - sum(fresh))
+    return fresh
+
+
+def iter_unseen(draw, count, used_questions, max_dry_rounds=20):
+    """Yield ``count`` questions from ``draw(n)`` whose text is not in ``used_questions``.
+
+    ``draw(n)`` must return an iterator of about ``n`` fresh random questions.
+    Candidates are claimed in batches no larger than what is still needed, so
+    nothing is marked as issued without being yielded.
+    """
+    produced = dry_rounds = 0
+    while produced < count:
+        remaining = min(count - produced, CLAIM_BATCH)
+        batch = list(itertools.islice(draw(remaining), remaining))
+        fresh = claim_unseen(used_questions, [q["question"] for q in batch])
+        new_questions = [q for q, is_new in zip(batch, fresh) if is_new]
+        if not new_questions:
+            dry_rounds += 1
+            if dry_rounds >= max_dry_rounds or not batch:
+                raise CapacityError(
+                    f"no unseen questions left after {produced} of {count} "
+                    f"({max_dry_rounds} consecutive draws were all duplicates)"
+                )
+            continue
+        dry_rounds = 0
+        for q in new_questions:
+            yield q
+        produced += len(new_questions)
@@ -0,0 +1,6 @@
+class CapacityError(ValueError):
+    """More unique questions were requested than the generators can produce."""
+
+
+class ExpressionLimitError(ValueError):
+    """An expression would exceed the evaluation cost limits, or divides by zero."""
@@ -0,0 +1,49 @@
+"""Deferred explanation text.
+
+Generators store an :class:`Explanation` in a question's ``"explanation"`` field. It
+holds a module-level render function and the step records that function needs, and
+builds the text only when the question is displayed or exported. Questions that are
+never shown with their explanation, or are exported without answers, skip the
+formatting entirely.
+"""
+from . import metrics
+
+
+class Explanation:
+    __slots__ = ("render_fn", "args", "_text")
+
+    def __init__(self, render_fn, *args):
+        self.render_fn = render_fn
+        self.args = args
+        self._text = None
+
+    def render(self):
+        """Return the explanation in the render function's shape (a string or a list of lines)."""
+        text = self._text
+        if text is None:
+            args = self.args
+            # Cached explanations are shared across threads; another one may have just
+            # rendered the text and dropped the args.
+            text = self._text
+            if text is None:
+                with metrics.timer("qbank_explanation_render_seconds", fn=getattr(self.render_fn, "__name__", "render")):
+                    text = self._text = self.render_fn(*args)
+                # The records are not needed once the text exists.
+                self.args = ()
+        return text
+
+    def __str__(self):
+        text = self.render()
+        return text if isinstance(text, str) else "\n".join(text)
+
+    def __repr__(self):
+        return f"Explanation({getattr(self.render_fn, '__name__', self.render_fn)})"
+
+
+def render_explanation(value):
+    return value.render() if isinstance(value, Explanation) else value
+
+def json_default(obj):
+    if isinstance(obj, Explanation):
+        return obj.render()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,93 @@
+"""Incremental question export.
+
+:class:`QuestionExport` serializes each question exactly once into an
+append-only NDJSON spool (kept in memory up to a limit, then on disk).
+Appended questions wait until a payload is requested, so their lazy
+explanations are rendered only for questions that are actually exported. The
+download payloads (JSON array, NDJSON, gzipped NDJSON) are cached until the
+next append, so reruns that add nothing cost nothing.
+"""
+import gzip
+import json
+import tempfile
+
+from . import metrics
+from .explain import json_default
+
+# format -> (file name, MIME type)
+EXPORT_FORMATS = {
+    "json": ("questions.json", "application/json"),
+    "ndjson": ("questions.ndjson", "application/x-ndjson"),
+    "ndjson.gz": ("questions.ndjson.gz", "application/gzip"),
+}
+SPOOL_MAX_BYTES = 8 * 1024 * 1024
+# Fields dropped from question-only exports; their explanations are then never rendered.
+ANSWER_FIELDS = ("answer", "explanation")
+
+
+def dumps_question(q, questions_only=False):
+    if questions_only:
+        q = {key: value for key, value in q.items() if key not in ANSWER_FIELDS}
+    return json.dumps(q, default=json_default)
+
+
+class QuestionExport:
+    def __init__(self, spool_max_bytes=SPOOL_MAX_BYTES):
+        self._spool = tempfile.SpooledTemporaryFile(max_size=spool_max_bytes, mode="w+b")
+        self._pending = []
+        self._count = 0
+        self._payloads = {}
+
+    def __len__(self):
+        return self._count
+
+    def append(self, questions):
+        questions = list(questions)
+        self._pending.extend(questions)
+        self._count += len(questions)
+        if questions:
+            self._payloads.clear()
+
+    def close(self):
+        self._spool.close()
+        self._pending.clear()
+        self._payloads.clear()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        write = self._spool.write
+        with metrics.timer("qbank_export_serialize_seconds", stage="ndjson"):
+            for q in self._pending:
+                write(dumps_question(q).encode("utf-8"))
+                write(b"\n")
+        if metrics.enabled:
+            metrics.inc("qbank_export_questions_total", len(self._pending))
+        self._pending.clear()
+
+    def ndjson(self):
+        self._flush()
+        self._spool.seek(0)
+        data = self._spool.read()
+        self._spool.seek(0, 2)
+        return data
+
+    def payload(self, fmt):
+        if fmt not in EXPORT_FORMATS:
+            raise ValueError(f"unknown export format {fmt!r}; choose from {sorted(EXPORT_FORMATS)}")
+        cached = self._payloads.get(fmt)
+        if cached is not None:
+            return cached
+        ndjson = self._payloads.get("ndjson")
+        if ndjson is None:
+            ndjson = self._payloads["ndjson"] = self.ndjson()
+        with metrics.timer("qbank_export_serialize_seconds", stage=fmt):
+            if fmt == "json":
+                # The NDJSON lines are already valid JSON values; joining them is enough.
+                data = b"[" + b",\n".join(ndjson.splitlines()) + b"]"
+            elif fmt == "ndjson.gz":
+                data = gzip.compress(ndjson, compresslevel=6)
+            else:
+                data = ndjson
+        self._payloads[fmt] = data
+        return data
@@ -0,0 +1,316 @@
+"""Expression conversion and evaluation questions (infix, prefix, postfix)."""
+import operator
+import random
+import re
+
+from . import metrics
+from .errors import ExpressionLimitError
+from .explain import Explanation
+from .memo import LRUCache
+from .trace import DeltaTrace, display_list
+
+# ----- OPERATORS AND FUNCTIONS FOR EXPRESSION EVALUATION -----
+operators = {
+    '+': (1, operator.add),
+    '-': (1, operator.sub),
+    '*': (2, operator.mul),
+    '/': (2, operator.floordiv),
+    '%': (2, operator.mod),
+    '^': (3, operator.pow)
+}
+operator_symbols = tuple(operators)
+precedence = {op: prec for op, (prec, _) in operators.items()}
+# Results are bounded before they are computed; 4096 bits is about 1,200 decimal digits,
+# which keeps every evaluation step cheap and every answer printable.
+MAX_RESULT_BITS = 4096
+MAX_EXPRESSION_ATTEMPTS = 100
+# Solved expressions keyed on (tokens, max_bits), shared by every session in the process.
+EXPRESSION_CACHE_SIZE = 4096
+expression_cache = LRUCache(EXPRESSION_CACHE_SIZE)
+metrics.register_cache("expression", expression_cache)
+
+def random_infix(rng=random):
+    ops = [rng.choice(operator_symbols) for _ in range(rng.randint(2, 3))]
+    operands = [str(rng.randint(1, 10)) for _ in range(len(ops) + 1)]
+    return ' '.join(sum(zip(operands, ops), ()) + (operands[-1],))
+
+def generate_expression_question(rng=random, max_bits=MAX_RESULT_BITS):
+    # Expressions that are too costly to evaluate (or divide by zero) are redrawn.
+    for _ in range(MAX_EXPRESSION_ATTEMPTS):
+        try:
+            return expression_questions(random_infix(rng), max_bits)
+        except ExpressionLimitError:
+            continue
+    raise ExpressionLimitError(
+        f"no expression within {max_bits} bits after {MAX_EXPRESSION_ATTEMPTS} attempts"
+    )
+
+def expression_questions(infix, max_bits=MAX_RESULT_BITS, cache=expression_cache):
+    """The postfix-evaluation, prefix and postfix questions for ``infix`` as fresh dicts.
+
+    Solutions come from ``cache`` when the same tokens were solved before; pass
+    ``cache=None`` to always solve.
+    """
+    tokens = tokenize(infix)
+    if cache is None:
+        solved = solve_expression(tokens, max_bits)
+    else:
+        solved = cache.get_or_compute((tokens, max_bits), lambda: solve_expression(tokens, max_bits))
+    if isinstance(solved, str):
+        raise ExpressionLimitError(solved)
+    return [
+        {"type": "expression", "subtopic": "Expression Evaluation", "level": "Auto",
+         "question": question, "answer": answer, "explanation": explanation}
+        for question, answer, explanation in solved
+    ]
+
+def solve_expression(tokens, max_bits=MAX_RESULT_BITS):
+    """(question, answer, explanation) triples for ``tokens``, or the rejection message.
+
+    Rejections are returned rather than raised so they can be cached as well.
+    """
+    # Tokenize once; each question's answer and explanation come from the same traced pass.
+    postfix_tokens, postfix_trace = trace_conversion(tokens)
+    try:
+        value, evaluation_trace = trace_evaluation(postfix_tokens, max_bits)
+    except ExpressionLimitError as exc:
+        return str(exc)
+    prefix_tokens, prefix_trace = trace_conversion(tokens[::-1], prefix=True)
+    infix = ' '.join(tokens)
+    postfix = ' '.join(postfix_tokens)
+    prefix = ' '.join(prefix_tokens[::-1])
+    # Explanations are shared by every hit and render their text at most once.
+    return (
+        (f"Evaluate postfix: {postfix}", value, Explanation(render_postfix_evaluation, evaluation_trace)),
+        (f"Convert infix to prefix: {infix}", prefix, Explanation(render_conversion, prefix_trace, prefix_tokens, True)),
+        (f"Convert infix to postfix: {infix}", postfix, Explanation(render_conversion, postfix_trace, postfix_tokens)),
+    )
+
+def iter_expression_questions(count, rng=random, max_bits=MAX_RESULT_BITS):
+    for _ in range(count):
+        yield from generate_expression_question(rng, max_bits)
+
+# ----- EXPRESSION ENGINE -----
+# Solvers and explainers share one pass: the conversion and evaluation below record
+# delta-encoded stack traces, answers are read off the same pass and explanation text is
+# rendered from the traces only when it is needed.
+# One match per token: an optionally signed integer, an operator or parenthesis, or any
+# other non-space character (an error). Whitespace between tokens is optional.
+TOKEN_PATTERN = re.compile(r"(-?\d+)|([-+*/%^()])|(\S)")
+
+def tokenize(expr, postfix=False):
+    """Split ``expr`` into a tuple of operand, operator and parenthesis tokens in one pass.
+
+    Multi-digit operands need no spaces around them ("12*(3+4)"). A '-' glued to the
+    digits after it is a sign at the start of an infix expression or after an operator
+    or '(' ("-3*(-4)"); in ``postfix`` input operands must be separated anyway, so a
+    glued '-' is always a sign ("3 -4 +"). A sign before '(' ("-(3+4)") is rejected
+    rather than misread as subtraction. Raises ValueError on any other character.
+    """
+    tokens = []
+    append = tokens.append
+    for match in TOKEN_PATTERN.finditer(expr):
+        token = match.group()
+        kind = match.lastindex
+        if kind == 1:
+            if token[0] == '-' and not postfix and tokens and (is_operand(tokens[-1]) or tokens[-1] == ')'):
+                append('-')
+                token = token[1:]
+        elif kind == 3:
+            raise ValueError(f"Unexpected character {token!r} at position {match.start()} in {expr!r}")
+        elif token == '(' and not postfix and tokens and tokens[-1] == '-' and (
+            len(tokens) == 1 or not (is_operand(tokens[-2]) or tokens[-2] == ')')
+        ):
+            raise ValueError(f"Unary minus before '(' at position {match.start()} in {expr!r}; write 0 - (...) instead")
+        append(token)
+    return tuple(tokens)
+
+def is_operand(token):
+    return token[-1].isdigit()
+
+def trace_conversion(tokens, prefix=False):
+    """Shunting-yard over ``tokens``; returns (output tokens, operator-stack trace).
+
+    For prefix conversion pass the reversed infix tokens with ``prefix=True``: the
+    parentheses swap roles and an equal-precedence operator stays on the stack, which
+    keeps left associativity once the output is reversed. Each step's note names what
+    it did; steps that emit output take the next output token, so output needs no trace.
+    Raises ValueError on unbalanced parentheses or an operator missing an operand.
+    """
+    opening, closing = (')', '(') if prefix else ('(', ')')
+    # Pop while the stacked operator binds at least as tightly (postfix) or strictly tighter (prefix).
+    strict = 1 if prefix else 0
+    output, stack = [], []
+    trace = DeltaTrace()
+    emit, step = output.append, trace.step
+    # Operands and operators must alternate: an operand or opening parenthesis is due at
+    # the start, after an operator and after an opening parenthesis.
+    want_operand = True
+
+    def pop():
+        token = stack.pop()
+        trace.pop(token)
+        return token
+
+    def malformed(problem):
+        shown = tokens[::-1] if prefix else tokens
+        return ValueError(f"{problem} in {' '.join(shown)!r}")
+
+    for token in tokens:
+        if token[-1].isdigit():
+            if not want_operand:
+                raise malformed(f"Missing operator next to operand {token}")
+            want_operand = False
+            emit(token)
+            step("operand")
+        elif token == opening:
+            if not want_operand:
+                raise malformed(f"Missing operator next to '{token}'")
+            stack.append(token)
+            trace.push(token)
+            step("push_open", stack)
+        elif token == closing:
+            if want_operand:
+                raise malformed(f"Missing operand next to '{token}'")
+            while stack and stack[-1] != opening:
+                emit(pop())
+                step("pop", stack)
+            if not stack:
+                raise malformed("Unbalanced parentheses")
+            pop()
+            step("pop_open", stack)
+        elif token in precedence:
+            if want_operand:
+                raise malformed(f"Operator {token} is missing an operand")
+            want_operand = True
+            prec = precedence[token] + strict
+            while stack and stack[-1] != opening and prec <= precedence.get(stack[-1], 0):
+                emit(pop())
+                step("pop_precedence", stack)
+            stack.append(token)
+            trace.push(token)
+            step("push_operator", stack)
+        else:
+            raise malformed(f"Unexpected token {token!r}")
+    if want_operand:
+        raise malformed("Missing operand")
+    while stack:
+        if stack[-1] == opening:
+            raise malformed("Unbalanced parentheses")
+        emit(pop())
+        step("pop_remaining", stack)
+    return output, trace
+
+def checked_apply(token, a, b, max_bits=MAX_RESULT_BITS):
+    """Apply ``token`` to ``a`` and ``b`` once the result is known to fit in ``max_bits``.
+
+    The bound comes from the operands' bit lengths, so an oversized power or product
+    is rejected before any work is done on it.
+    """
+    if token == '^':
+        if b < 0:
+            raise ExpressionLimitError(f"negative exponent in {a} ^ {b}")
+        # |a| ^ b has at least (bit_length(a) - 1) * b + 1 bits.
+        if abs(a) > 1 and (abs(a).bit_length() - 1) * b + 1 > max_bits:
+            raise ExpressionLimitError(f"{a} ^ {b} exceeds {max_bits} bits")
+    elif token == '*':
+        if a and b and a.bit_length() + b.bit_length() - 1 > max_bits:
+            raise ExpressionLimitError(f"{a} * {b} exceeds {max_bits} bits")
+    elif token in ('/', '%'):
+        if b == 0:
+            raise ExpressionLimitError(f"division by zero in {a} {token} {b}")
+    elif max(a.bit_length(), b.bit_length()) >= max_bits:
+        raise ExpressionLimitError(f"{a} {token} {b} exceeds {max_bits} bits")
+    return operators[token][1](a, b)
+
+def trace_evaluation(tokens, max_bits=MAX_RESULT_BITS):
+    """Evaluate postfix ``tokens``; returns (value, stack trace noted with each step's token).
+
+    Raises ExpressionLimitError when a step would exceed ``max_bits`` or divide by zero,
+    and ValueError when ``tokens`` is not a complete postfix expression.
+    """
+    stack = []
+    trace = DeltaTrace()
+    for token in tokens:
+        if token[-1].isdigit():
+            value = int(token)
+            stack.append(value)
+            trace.push(value)
+            trace.step(token, stack)
+        elif token not in operators:
+            raise ValueError(f"Unexpected token {token!r} in postfix expression {' '.join(tokens)!r}")
+        elif len(stack) < 2:
+            raise ValueError(f"Operator {token} is missing an operand in {' '.join(tokens)!r}")
+        else:
+            b, a = stack.pop(), stack.pop()
+            result = checked_apply(token, a, b, max_bits)
+            stack.append(result)
+            trace.pop(b)
+            trace.pop(a)
+            trace.push(result)
+            trace.step(token, stack)
+    if len(stack) != 1:
+        problem = "is empty" if not stack else f"leaves {len(stack)} values on the stack"
+        raise ValueError(f"Postfix expression {' '.join(tokens)!r} {problem}")
+    return stack[0], trace
+
+CONVERSION_STEPS = {
+    "operand": "Add operand {token} to output: {output}",
+    "pop": "Pop {token} from stack to output: {output}",
+    "pop_precedence": "Pop {token} from stack to output due to precedence: {output}",
+    "pop_remaining": "Pop remaining {token} from stack to output: {output}",
+}
+
+def render_conversion(trace, output, prefix=False):
+    opening = ')' if prefix else '('
+    lines = [f"**Infix to {'Prefix' if prefix else 'Postfix'} Conversion Explanation:**\n"]
+    emitted = 0
+    for kind, _, stack in trace.replay():
+        if kind == "push_open":
+            lines.append(f"Push '{opening}' to stack: {display_list(stack)}")
+        elif kind == "pop_open":
+            lines.append(f"Pop '{opening}' from stack")
+        elif kind == "push_operator":
+            lines.append(f"Push operator {stack[-1]} to stack: {display_list(stack)}")
+        else:
+            emitted += 1
+            lines.append(CONVERSION_STEPS[kind].format(
+                token=output[emitted - 1], output=' '.join(output[:emitted])
+            ))
+    if prefix:
+        lines.append(f"Final prefix expression: {' '.join(output[::-1])}")
+    else:
+        lines.append(f"Final postfix expression: {' '.join(output)}")
+    return "\n".join(lines)
+
+def render_postfix_evaluation(trace):
+    lines = ["**Postfix Expression Evaluation Explanation:**\n"]
+    stack = []
+    for token, deltas, stack in trace.replay():
+        if len(deltas) == 1:
+            lines.append(f"Push {token} to stack: {display_list(stack)}")
+        else:
+            b, a, result = deltas[0][1], deltas[1][1], deltas[2][1]
+            lines.append(f"Pop {a} and {b}, compute {a} {token} {b} = {result}, push result: {display_list(stack)}")
+    lines.append(f"Result on stack is {stack[0]} which is the answer.")
+    return "\n".join(lines)
+
+def infix_to_postfix(expr):
+    return ' '.join(trace_conversion(tokenize(expr))[0])
+
+def infix_to_prefix(expr):
+    return ' '.join(trace_conversion(tokenize(expr)[::-1], prefix=True)[0][::-1])
+
+def evaluate_postfix(expr):
+    return trace_evaluation(tokenize(expr, postfix=True))[0]
+
+def explain_expression_postfix(postfix_expr):
+    return render_postfix_evaluation(trace_evaluation(tokenize(postfix_expr, postfix=True))[1])
+
+def explain_expression_infix_to_postfix(infix_expr):
+    output, trace = trace_conversion(tokenize(infix_expr))
+    return render_conversion(trace, output)
+
+def explain_expression_infix_to_prefix(infix_expr):
+    output, trace = trace_conversion(tokenize(infix_expr)[::-1], prefix=True)
+    return render_conversion(trace, output, prefix=True)
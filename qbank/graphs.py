@@ -0,0 +1,272 @@
+"""Random graph generators and a deque-based BFS engine for queue numericals.
+
+Graphs are adjacency lists over node ids ``0..n-1`` with neighbours sorted by id, so
+BFS order is fully determined by the graph. Every generator and traversal is linear in
+nodes plus edges, which keeps answer keys for graphs of 10^5 nodes cheap.
+"""
+import math
+import random
+import string
+from collections import deque
+
+from .explain import Explanation
+
+GRAPH_KINDS = ("tree", "dag", "gnp", "grid")
+BFS_VARIANTS = ("traversal", "level_order", "shortest_path", "multi_source")
+# Queue snapshots are copies of the whole queue, so only the first steps are recorded.
+MAX_SNAPSHOTS = 50
+GRID_BLOCK_RATE = 0.2
+
+GRAPH_PARAMS = {
+    "Level 1": {"kinds": ("tree",), "nodes": (5, 7), "variants": ("traversal", "level_order")},
+    "Level 2": {"kinds": ("tree", "dag", "gnp"), "nodes": (6, 9), "variants": ("traversal", "level_order", "shortest_path")},
+    "Level 3": {"kinds": ("dag", "gnp", "grid"), "nodes": (8, 12), "variants": ("traversal", "shortest_path", "multi_source")},
+}
+
+
+class Graph:
+    __slots__ = ("kind", "adj", "directed", "root", "shape", "blocked")
+
+    def __init__(self, kind, adj, directed=False, root=0, shape=None, blocked=frozenset()):
+        self.kind = kind
+        self.adj = adj
+        self.directed = directed
+        self.root = root
+        self.shape = shape
+        self.blocked = blocked
+
+    def __len__(self):
+        return len(self.adj)
+
+    def label(self, node):
+        if self.shape is not None:
+            return f"({node // self.shape[1]},{node % self.shape[1]})"
+        if len(self.adj) <= 26:
+            return string.ascii_uppercase[node]
+        return str(node)
+
+    def open_nodes(self):
+        return [v for v in range(len(self.adj)) if v not in self.blocked]
+
+
+# ----- GENERATORS -----
+def _relabel(adj, rng, keep=0):
+    """Shuffle node ids so labels carry no hint of the construction order; returns (adj, new id of ``keep``)."""
+    n = len(adj)
+    perm = list(range(n))
+    rng.shuffle(perm)
+    relabeled = [None] * n
+    for old, neighbours in enumerate(adj):
+        relabeled[perm[old]] = sorted(perm[w] for w in neighbours)
+    return relabeled, perm[keep]
+
+def random_tree(n, rng=random):
+    adj = [[] for _ in range(n)]
+    for child in range(1, n):
+        parent = rng.randrange(child)
+        adj[parent].append(child)
+        adj[child].append(parent)
+    adj, root = _relabel(adj, rng)
+    return Graph("tree", adj, root=root)
+
+def random_dag(n, max_out_degree=3, rng=random):
+    """Edges only go from lower to higher construction ids, so the graph is acyclic."""
+    adj = []
+    for v in range(n):
+        later = n - v - 1
+        k = rng.randint(1, max_out_degree) if later else 0
+        adj.append(sorted(rng.sample(range(v + 1, n), min(k, later))))
+    adj, root = _relabel(adj, rng)
+    return Graph("dag", adj, directed=True, root=root)
+
+def gnp_edges(n, p, rng=random):
+    """Yield the undirected edges (w, v), w < v, of an Erdős–Rényi G(n, p) graph in O(n + m).
+
+    Uses geometric skipping (Batagelj & Brandes) instead of testing all n^2 pairs.
+    """
+    if p <= 0:
+        return
+    if p >= 1:
+        for v in range(1, n):
+            for w in range(v):
+                yield w, v
+        return
+    log_q = math.log(1 - p)
+    v, w = 1, -1
+    while v < n:
+        w += 1 + int(math.log(1 - rng.random()) / log_q)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            yield w, v
+
+def random_gnp(n, p=None, rng=random):
+    if p is None:
+        # Roughly two neighbours per node keeps small graphs connected-ish and readable.
+        p = min(1.0, 2.5 / max(n - 1, 1))
+    adj = [[] for _ in range(n)]
+    for w, v in gnp_edges(n, p, rng):
+        adj[w].append(v)
+        adj[v].append(w)
+    adj, root = _relabel(adj, rng)
+    return Graph("gnp", adj, root=root)
+
+def random_grid(rows, cols, block_rate=GRID_BLOCK_RATE, rng=random):
+    n = rows * cols
+    blocked = {v for v in range(1, n) if rng.random() < block_rate}
+    adj = [[] for _ in range(n)]
+    for v in range(n):
+        if v in blocked:
+            continue
+        r, c = divmod(v, cols)
+        # Neighbour ids in increasing order: up, left, right, down.
+        for nr, nc in ((r - 1, c), (r, c - 1), (r, c + 1), (r + 1, c)):
+            if 0 <= nr < rows and 0 <= nc < cols:
+                w = nr * cols + nc
+                if w not in blocked:
+                    adj[v].append(w)
+    return Graph("grid", adj, root=0, shape=(rows, cols), blocked=frozenset(blocked))
+
+def random_graph(kind, n, rng=random):
+    if kind == "tree":
+        return random_tree(n, rng)
+    if kind == "dag":
+        return random_dag(n, rng=rng)
+    if kind == "gnp":
+        return random_gnp(n, rng=rng)
+    if kind == "grid":
+        rows = max(2, int(math.sqrt(n)))
+        return random_grid(rows, -(-n // rows), rng=rng)
+    raise ValueError(f"Unknown graph kind {kind!r}; expected one of {GRAPH_KINDS}")
+
+
+# ----- BFS -----
+class BFSResult:
+    __slots__ = ("order", "dist", "parent", "snapshots")
+
+    def __init__(self, order, dist, parent, snapshots):
+        self.order = order
+        self.dist = dist
+        self.parent = parent
+        self.snapshots = snapshots
+
+    def levels(self):
+        levels = []
+        for v in self.order:
+            d = self.dist[v]
+            if d == len(levels):
+                levels.append([])
+            levels[d].append(v)
+        return levels
+
+    def path_to(self, target):
+        if self.dist[target] < 0:
+            return None
+        path = []
+        while target >= 0:
+            path.append(target)
+            target = self.parent[target]
+        path.reverse()
+        return path
+
+
+def bfs(adj, sources, max_snapshots=MAX_SNAPSHOTS):
+    """Breadth-first search from one or more sources, marking nodes when they are enqueued.
+
+    Records ``(node, queue after expanding node)`` for the first ``max_snapshots`` steps.
+    """
+    n = len(adj)
+    dist = [-1] * n
+    parent = [-1] * n
+    queue = deque()
+    for s in sources:
+        if dist[s] < 0:
+            dist[s] = 0
+            queue.append(s)
+    order, snapshots = [], []
+    while queue:
+        v = queue.popleft()
+        order.append(v)
+        next_dist = dist[v] + 1
+        for w in adj[v]:
+            if dist[w] < 0:
+                dist[w] = next_dist
+                parent[w] = v
+                queue.append(w)
+        if len(snapshots) < max_snapshots:
+            snapshots.append((v, list(queue)))
+    return BFSResult(order, dist, parent, snapshots)
+
+
+# ----- QUESTIONS -----
+def describe_graph(graph):
+    if graph.shape is not None:
+        rows, cols = graph.shape
+        lines = [
+            ''.join('#' if r * cols + c in graph.blocked else '.' for c in range(cols))
+            for r in range(rows)
+        ]
+        return "Grid ('.' open, '#' blocked; moves go up, left, right, down):\n" + "\n".join(lines)
+    label = graph.label
+    # Node order, not label order: numeric labels sort as text (0, 1, 10, 100, ...).
+    edges = {label(v): [label(w) for w in graph.adj[v]] for v in range(len(graph))}
+    return f"{'Directed edges' if graph.directed else 'Edges'}: {edges}"
+
+def explain_bfs(graph, result):
+    label = graph.label
+    explanation = [
+        f"Visited: {label(v)}, Queue State: {[label(w) for w in queue]}" for v, queue in result.snapshots
+    ]
+    if len(result.order) > len(result.snapshots):
+        explanation.append(f"... {len(result.order) - len(result.snapshots)} more steps")
+    return explanation
+
+def bfs_question(graph, variant, rng=random, max_snapshots=MAX_SNAPSHOTS):
+    """Build (question, answer, explanation) for one BFS variant on ``graph``."""
+    label = graph.label
+    start = graph.root
+    graph_text = describe_graph(graph)
+
+    if variant == "multi_source":
+        candidates = graph.open_nodes()
+        sources = sorted(rng.sample(candidates, min(2, len(candidates))))
+        result = bfs(graph.adj, sources, max_snapshots)
+        source_text = ', '.join(label(s) for s in sources)
+        distances = ', '.join(
+            f"{label(v)}={result.dist[v] if result.dist[v] >= 0 else 'unreachable'}"
+            for v in candidates
+        )
+        question = f"Run a multi-source BFS starting from {source_text} at the same time.\n{graph_text}\nWhat is the distance of every node from its nearest source?"
+        answer = f"Distances: {distances}"
+        return question, answer, Explanation(explain_bfs, graph, result)
+
+    result = bfs(graph.adj, [start], max_snapshots)
+    if variant == "level_order":
+        levels = ' | '.join(
+            f"Level {d}: {', '.join(label(v) for v in level)}" for d, level in enumerate(result.levels())
+        )
+        question = f"Group the nodes by BFS level starting from node {label(start)}.\n{graph_text}\nWhich nodes are on each level?"
+        answer = levels
+    elif variant == "shortest_path":
+        reachable = result.order[1:] or result.order
+        target = rng.choice(reachable)
+        path = result.path_to(target)
+        question = f"Using BFS, find the shortest path (fewest edges) from {label(start)} to {label(target)}.\n{graph_text}\nWhat is the path and its length?"
+        answer = f"Shortest Path: {' -> '.join(label(v) for v in path)} (length {len(path) - 1})"
+    elif variant == "traversal":
+        question = f"Perform BFS traversal on the graph starting from node {label(start)}.\n{graph_text}\nWhat is the order of traversal?"
+        answer = f"BFS Order: {' -> '.join(label(v) for v in result.order)}"
+    else:
+        raise ValueError(f"Unknown BFS variant {variant!r}; expected one of {BFS_VARIANTS}")
+    return question, answer, Explanation(explain_bfs, graph, result)
+
+def graph_question(level, rng=random, kind=None, nodes=None, variant=None):
+    params = GRAPH_PARAMS.get(level, GRAPH_PARAMS["Level 1"])
+    if kind is None:
+        kind = rng.choice(params["kinds"])
+    if nodes is None:
+        nodes = rng.randint(*params["nodes"])
+    if variant is None:
+        variant = rng.choice(params["variants"])
+    return bfs_question(random_graph(kind, nodes, rng), variant, rng)
@@ -0,0 +1,249 @@
+"""Table-driven interpreter for deque, queue and circular-queue operation scripts.
+
+A script such as ``["appendleft(3)", "append(5)", "pop()"]`` is parsed once into
+``(handler, arg, text)`` steps by looking each opcode up in a dispatch table, and the
+steps are then run against a machine state without any per-op ``eval``. Traces are
+kept as delta-encoded step records and formatted by ``render_trace`` on demand.
+
+``DEQUE_OPS`` runs the deque scripts of the stack bank's Code Tracing snippets, which
+are plain ``collections.deque`` calls. ``QUEUE_OPS`` runs textbook ENQUEUE/DEQUEUE
+scripts; no snippet uses it, because those ops are not Python. The queue numericals
+draw ready-compiled programs from ``CIRCULAR_QUEUE_OPS`` and ``RING_DEQUE_OPS``
+(see :func:`qbank.numericals.random_program`), so they skip the parse step.
+"""
+import re
+from collections import deque
+
+from .trace import DeltaTrace, display_list
+
+OP_PATTERN = re.compile(r"\s*(\w+)\(\s*(-?\d+)?\s*\)\s*")
+
+
+class CircularQueue:
+    """Fixed-size array-backed FIFO ring buffer; ``rear`` starts at -1 as in the textbook layout."""
+
+    __slots__ = ("size", "slots", "front", "rear", "count")
+
+    def __init__(self, size):
+        self.size = size
+        self.slots = [None] * size
+        self.front, self.rear = 0, -1
+        self.count = 0
+
+
+class RingDeque:
+    """Fixed-size array-backed double-ended queue; elements run from ``front`` for ``count`` slots."""
+
+    __slots__ = ("size", "slots", "front", "count")
+
+    def __init__(self, size):
+        self.size = size
+        self.slots = [None] * size
+        self.front = 0
+        self.count = 0
+
+    @property
+    def rear(self):
+        return (self.front + self.count - 1) % self.size
+
+    def items(self):
+        slots, front, size = self.slots, self.front, self.size
+        return [slots[(front + i) % size] for i in range(self.count)]
+
+
+# ----- STEP FORMATTERS -----
+# A traced run keeps one DeltaTrace of the machine's contents (the slot array for ring
+# buffers, the elements for deques and queues). Each step's note is (op text, record),
+# where a record is (formatter, *scalars); ``render_trace`` replays the deltas and calls
+# ``formatter(state, *scalars)`` only when an explanation is shown or exported.
+def _ring_items(slots, front, count):
+    size = len(slots)
+    return [slots[(front + i) % size] for i in range(count)]
+
+def _format_deque(items):
+    return f"Deque State: deque({display_list(items)})"
+
+def _format_queue(items):
+    return f"Queue State: {display_list(items)}"
+
+def _format_enqueue(slots, rear):
+    return f"Rear moved to {rear}, Queue State: {display_list(slots)}"
+
+def _format_dequeue(slots, front, next_front, value):
+    # The trace shows the buffer before the dequeued slot is cleared.
+    shown = list(slots)
+    shown[front] = value
+    return f"Front moved from {front} to {next_front}, Queue State: {display_list(shown)}"
+
+def _format_queue_overflow(slots, value):
+    return f"Overflow: queue is full, {value} not inserted, Queue State: {display_list(slots)}"
+
+def _format_queue_underflow(slots, front):
+    return f"Underflow: queue is empty, Front stays at {front}, Queue State: {display_list(slots)}"
+
+def _format_ring_deque(slots, front, count):
+    rear = (front + count - 1) % len(slots)
+    return f"Deque State: {display_list(_ring_items(slots, front, count))}, Front Index: {front}, Rear Index: {rear}"
+
+def _format_ring_overflow(slots, front, count, value):
+    return f"Overflow: deque is full, {value} not inserted, {_format_ring_deque(slots, front, count)}"
+
+def _format_ring_underflow(slots, front, count):
+    return f"Underflow: deque is empty, {_format_ring_deque(slots, front, count)}"
+
+
+# ----- HANDLERS -----
+# A handler applies one op to the machine state, reports its changes to ``trace`` and
+# returns its step record; with ``trace=None`` (bulk runs) it records nothing.
+def _deque_handler(method, delta, takes_arg):
+    if takes_arg:
+        def handler(dq, arg, trace):
+            method(dq, arg)
+            if trace is not None:
+                delta(trace, arg)
+                return (_format_deque,)
+    else:
+        def handler(dq, arg, trace):
+            value = method(dq)
+            if trace is not None:
+                delta(trace, value)
+                return (_format_deque,)
+    return handler, takes_arg
+
+def _queue_handler(method, delta, takes_arg):
+    if takes_arg:
+        def handler(q, arg, trace):
+            method(q, arg)
+            if trace is not None:
+                delta(trace, arg)
+                return (_format_queue,)
+    else:
+        def handler(q, arg, trace):
+            value = method(q)
+            if trace is not None:
+                delta(trace, value)
+                return (_format_queue,)
+    return handler, takes_arg
+
+def _store(state, index, value, trace):
+    if trace is not None:
+        trace.set(index, value, state.slots[index])
+    state.slots[index] = value
+
+def _circular_enqueue(cq, value, trace):
+    if cq.count == cq.size:
+        return (_format_queue_overflow, value) if trace is not None else None
+    cq.rear = (cq.rear + 1) % cq.size
+    _store(cq, cq.rear, value, trace)
+    cq.count += 1
+    return (_format_enqueue, cq.rear) if trace is not None else None
+
+def _circular_dequeue(cq, arg, trace):
+    if not cq.count:
+        return (_format_queue_underflow, cq.front) if trace is not None else None
+    front = cq.front
+    value = cq.slots[front]
+    cq.front = (front + 1) % cq.size
+    _store(cq, front, None, trace)
+    cq.count -= 1
+    return (_format_dequeue, front, cq.front, value) if trace is not None else None
+
+def _ring_append(rd, value, trace):
+    if rd.count == rd.size:
+        return (_format_ring_overflow, rd.front, rd.count, value) if trace is not None else None
+    _store(rd, (rd.front + rd.count) % rd.size, value, trace)
+    rd.count += 1
+    return (_format_ring_deque, rd.front, rd.count) if trace is not None else None
+
+def _ring_appendleft(rd, value, trace):
+    if rd.count == rd.size:
+        return (_format_ring_overflow, rd.front, rd.count, value) if trace is not None else None
+    rd.front = (rd.front - 1) % rd.size
+    _store(rd, rd.front, value, trace)
+    rd.count += 1
+    return (_format_ring_deque, rd.front, rd.count) if trace is not None else None
+
+def _ring_pop(rd, arg, trace):
+    if not rd.count:
+        return (_format_ring_underflow, rd.front, rd.count) if trace is not None else None
+    _store(rd, rd.rear, None, trace)
+    rd.count -= 1
+    return (_format_ring_deque, rd.front, rd.count) if trace is not None else None
+
+def _ring_popleft(rd, arg, trace):
+    if not rd.count:
+        return (_format_ring_underflow, rd.front, rd.count) if trace is not None else None
+    _store(rd, rd.front, None, trace)
+    rd.front = (rd.front + 1) % rd.size
+    rd.count -= 1
+    return (_format_ring_deque, rd.front, rd.count) if trace is not None else None
+
+# ----- DISPATCH TABLES -----
+DEQUE_OPS = {
+    "append": _deque_handler(deque.append, DeltaTrace.push, True),
+    "appendleft": _deque_handler(deque.appendleft, DeltaTrace.pushleft, True),
+    "pop": _deque_handler(deque.pop, DeltaTrace.pop, False),
+    "popleft": _deque_handler(deque.popleft, DeltaTrace.popleft, False),
+}
+QUEUE_OPS = {
+    "ENQUEUE": _queue_handler(deque.append, DeltaTrace.push, True),
+    "DEQUEUE": _queue_handler(deque.popleft, DeltaTrace.popleft, False),
+}
+CIRCULAR_QUEUE_OPS = {
+    "ENQUEUE": (_circular_enqueue, True),
+    "DEQUEUE": (_circular_dequeue, False),
+}
+RING_DEQUE_OPS = {
+    "append": (_ring_append, True),
+    "appendleft": (_ring_appendleft, True),
+    "pop": (_ring_pop, False),
+    "popleft": (_ring_popleft, False),
+}
+
+
+def parse_op(text):
+    match = OP_PATTERN.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Malformed operation {text!r}")
+    name, arg = match.groups()
+    return name, None if arg is None else int(arg)
+
+def compile_script(ops, table):
+    program = []
+    for text in ops:
+        name, arg = parse_op(text)
+        try:
+            handler, takes_arg = table[name]
+        except KeyError:
+            raise ValueError(f"Unknown operation {name!r} in {text!r}") from None
+        if takes_arg != (arg is not None):
+            raise ValueError(f"Operation {text!r} {'needs' if takes_arg else 'takes no'} argument")
+        program.append((handler, arg, text))
+    return program
+
+def run_program(program, state, trace=True):
+    """Run compiled steps against ``state``; return the DeltaTrace of the run, or None untraced.
+
+    Ring buffers are traced through their slot array, deques and queues through their elements.
+    """
+    if not trace:
+        for handler, arg, _ in program:
+            handler(state, arg, None)
+        return None
+    contents = getattr(state, "slots", state)
+    steps = DeltaTrace(contents)
+    for handler, arg, text in program:
+        record = handler(state, arg, steps)
+        steps.step((text, record), contents)
+    return steps
+
+def render_trace(steps):
+    """Format a traced run as "Operation: ... -> ..." lines."""
+    return [
+        f"Operation: {text} -> {record[0](state, *record[1:])}"
+        for (text, record), _, state in steps.replay()
+    ]
+
+def run_script(ops, table, state, trace=True):
+    steps = run_program(compile_script(ops, table), state, trace)
+    return render_trace(steps) if trace else []
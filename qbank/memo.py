@@ -0,0 +1,72 @@
+"""Bounded, thread-safe LRU cache shared by every session in a process.
+
+Expression questions draw from a small space of operands and operators, so the same
+expression recurs often in a large batch. :class:`LRUCache` keeps the most recently
+used results and counts hits, misses and evictions. All of its methods take one
+lock, so Streamlit sessions served from different threads can share one instance.
+"""
+import threading
+from collections import OrderedDict, namedtuple
+
+CacheStats = namedtuple("CacheStats", "hits misses evictions currsize maxsize")
+
+_MISSING = object()
+
+
+class LRUCache:
+    """Maps keys to values and evicts the least recently used entry above ``maxsize``.
+
+    ``maxsize=0`` disables caching while still counting misses.
+    """
+
+    def __init__(self, maxsize):
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key, compute):
+        """Return the cached value for ``key``, calling ``compute()`` and storing it on a miss.
+
+        ``compute`` runs outside the lock, so two threads may both compute a new key;
+        the later result wins.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def stats(self):
+        with self._lock:
+            return CacheStats(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,310 @@
+"""Optional in-process metrics: counters, latency histograms and cache statistics.
+
+Instrumentation is off unless ``QBANK_METRICS=1`` is set (or :func:`enable` is called).
+Hot paths check the module-level ``enabled`` flag before touching a clock or a lock,
+so disabled metrics cost one attribute lookup per instrumented call.
+
+Metrics are exposed as Prometheus text on a local HTTP endpoint
+(``QBANK_METRICS_PORT``) and/or as a JSON file rewritten periodically
+(``QBANK_METRICS_FILE``, every ``QBANK_METRICS_INTERVAL`` seconds); see
+:func:`start_from_env`.
+
+Metrics live in module globals, so process-pool workers record into their own copy.
+Pools submit jobs through :func:`call_recorded` (with :func:`reset` as the pool
+initializer) and :func:`merge` what each job returns; cache statistics stay per process.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+METRICS_ENV = "QBANK_METRICS"
+METRICS_PORT_ENV = "QBANK_METRICS_PORT"
+METRICS_FILE_ENV = "QBANK_METRICS_FILE"
+METRICS_INTERVAL_ENV = "QBANK_METRICS_INTERVAL"
+DEFAULT_DUMP_INTERVAL = 60.0
+# Upper bounds in seconds; one question takes microseconds, a page render or export milliseconds.
+LATENCY_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 5e-2, 0.1, 0.5, 1.0, 5.0)
+
+enabled = os.environ.get(METRICS_ENV, "") not in ("", "0")
+
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+_caches = {}
+_NULL_TIMER = contextlib.nullcontext()
+
+
+def enable():
+    global enabled
+    enabled = True
+
+def disable():
+    global enabled
+    enabled = False
+
+def reset():
+    with _lock:
+        _counters.clear()
+        _histograms.clear()
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def cumulative(self):
+        total, out = 0, []
+        for n in self.counts:
+            total += n
+            out.append(total)
+        return out
+
+
+# ----- RECORDING -----
+# Callers check ``metrics.enabled`` first on hot paths; these functions record unconditionally.
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+def _observe(key, seconds):
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = Histogram()
+        hist.counts[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        hist.sum += seconds
+        hist.count += 1
+
+def inc(name, value=1, **labels):
+    key = _key(name, labels)
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+def observe(name, seconds, **labels):
+    _observe(_key(name, labels), seconds)
+
+@contextlib.contextmanager
+def _timing(key):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _observe(key, time.perf_counter() - start)
+
+def timer(name, **labels):
+    """Context manager observing its body's duration; a shared no-op when disabled."""
+    return _timing(_key(name, labels)) if enabled else _NULL_TIMER
+
+def timed(fn, name, **labels):
+    """``fn`` wrapped to observe each call's duration, or ``fn`` itself when disabled."""
+    if not enabled:
+        return fn
+    key = _key(name, labels)
+    clock = time.perf_counter
+
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _observe(key, clock() - start)
+    return wrapper
+
+def timed_iter(iterable, name, **labels):
+    """Yield from ``iterable``, observing how long each item took to produce."""
+    key = _key(name, labels)
+    clock = time.perf_counter
+    iterator = iter(iterable)
+    while True:
+        start = clock()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        _observe(key, clock() - start)
+        yield item
+
+def drain():
+    """Remove and return this process's counters and histograms, for :func:`merge` elsewhere."""
+    with _lock:
+        counters = dict(_counters)
+        histograms = {key: (hist.counts, hist.sum, hist.count) for key, hist in _histograms.items()}
+        _counters.clear()
+        _histograms.clear()
+    return counters, histograms
+
+def merge(delta):
+    """Add a :func:`drain` result from another process to this one's metrics."""
+    counters, histograms = delta
+    with _lock:
+        for key, value in counters.items():
+            _counters[key] = _counters.get(key, 0) + value
+        for key, (counts, total, count) in histograms.items():
+            hist = _histograms.get(key)
+            if hist is None:
+                hist = _histograms[key] = Histogram()
+            hist.counts = [a + b for a, b in zip(hist.counts, counts)]
+            hist.sum += total
+            hist.count += count
+
+def call_recorded(fn, *args):
+    """Run ``fn(*args)`` with metrics on, in a pool worker; returns ``(result, drain())``."""
+    global enabled
+    was_enabled, enabled = enabled, True
+    try:
+        result = fn(*args)
+    finally:
+        enabled = was_enabled
+    return result, drain()
+
+def register_cache(name, cache):
+    """Report ``cache.stats()`` (hits, misses, evictions, currsize) under ``cache=name``."""
+    _caches[name] = cache
+
+
+# ----- EXPOSITION -----
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+def _cache_counters():
+    rows = {}
+    for name, cache in _caches.items():
+        stats = cache.stats()
+        labels = (("cache", name),)
+        for field in ("hits", "misses", "evictions"):
+            rows.setdefault(f"qbank_cache_{field}_total", []).append((labels, getattr(stats, field)))
+        rows.setdefault("qbank_cache_entries", []).append((labels, stats.currsize))
+    return rows
+
+def render_prometheus():
+    """All metrics in the Prometheus text exposition format."""
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = sorted((key, (hist.cumulative(), hist.sum, hist.count)) for key, hist in _histograms.items())
+    lines = []
+    last = None
+    for (name, labels), value in counters:
+        if name != last:
+            lines.append(f"# TYPE {name} counter")
+            last = name
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+    for name, rows in _cache_counters().items():
+        lines.append(f"# TYPE {name} {'gauge' if name == 'qbank_cache_entries' else 'counter'}")
+        lines.extend(f"{name}{_format_labels(labels)} {value}" for labels, value in rows)
+    last = None
+    for (name, labels), (cumulative, total, count) in histograms:
+        if name != last:
+            lines.append(f"# TYPE {name} histogram")
+            last = name
+        for bound, n in zip(LATENCY_BUCKETS + ("+Inf",), cumulative):
+            lines.append(f"{name}_bucket{_format_labels(labels, (('le', bound),))} {n}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {total}")
+        lines.append(f"{name}_count{_format_labels(labels)} {count}")
+    return "\n".join(lines) + "\n"
+
+def snapshot():
+    """JSON-ready copy of every metric."""
+    with _lock:
+        counters = [(name, dict(labels), value) for (name, labels), value in _counters.items()]
+        histograms = [
+            (name, dict(labels), hist.cumulative(), hist.sum, hist.count) for (name, labels), hist in _histograms.items()
+        ]
+    for name, rows in _cache_counters().items():
+        counters.extend((name, dict(labels), value) for labels, value in rows)
+    return {
+        "timestamp": time.time(),
+        "counters": [{"name": name, "labels": labels, "value": value} for name, labels, value in sorted(
+            counters, key=lambda row: (row[0], sorted(row[1].items())))],
+        "histograms": [
+            {"name": name, "labels": labels, "count": count, "sum": total,
+             "buckets": dict(zip(map(str, LATENCY_BUCKETS + ("+Inf",)), cumulative))}
+            for name, labels, cumulative, total, count in sorted(
+                histograms, key=lambda row: (row[0], sorted(row[1].items())))
+        ],
+    }
+
+def dump_json(path):
+    """Write :func:`snapshot` to ``path`` atomically."""
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as out:
+        json.dump(snapshot(), out, indent=1)
+    os.replace(tmp, path)
+
+
+def serve(port, host="127.0.0.1"):
+    """Serve ``/metrics`` (Prometheus text) and ``/metrics.json`` from a daemon thread."""
+    # Imported here: http.server is slow to import and only the endpoint needs it.
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path in ("/", "/metrics"):
+                body, content_type = render_prometheus().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8"
+            elif self.path == "/metrics.json":
+                body, content_type = json.dumps(snapshot()).encode("utf-8"), "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="qbank-metrics", daemon=True).start()
+    return server
+
+
+class JSONDumper:
+    """Rewrites a JSON snapshot every ``interval`` seconds, and once more on :meth:`stop`."""
+
+    def __init__(self, path, interval=DEFAULT_DUMP_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="qbank-metrics-dump", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            dump_json(self.path)
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        dump_json(self.path)
+
+
+def start_from_env():
+    """Start the endpoint and/or JSON dump configured in the environment.
+
+    Either setting also turns instrumentation on. Returns ``(server, dumper)``; each is
+    None when not configured.
+    """
+    port = os.environ.get(METRICS_PORT_ENV)
+    path = os.environ.get(METRICS_FILE_ENV)
+    server = dumper = None
+    if port:
+        enable()
+        server = serve(int(port))
+    if path:
+        enable()
+        dumper = JSONDumper(path, float(os.environ.get(METRICS_INTERVAL_ENV, DEFAULT_DUMP_INTERVAL)))
+    return server, dumper
@@ -0,0 +1,76 @@
+"""Randomized circular-queue and deque numericals simulated on array-backed ring buffers."""
+import random
+
+from .explain import Explanation
+from .interpreter import CIRCULAR_QUEUE_OPS, RING_DEQUE_OPS, CircularQueue, RingDeque, render_trace, run_program
+
+# Per-level defaults: capacity range, script length range and the chance that a step
+# on a full/empty buffer is turned into an overflow/underflow instead of being avoided.
+NUMERICAL_PARAMS = {
+    "Level 1": {"capacity": (4, 5), "length": (5, 7), "fault_rate": 0.0},
+    "Level 2": {"capacity": (5, 7), "length": (7, 10), "fault_rate": 0.15},
+    "Level 3": {"capacity": (6, 8), "length": (10, 14), "fault_rate": 0.3},
+}
+VALUE_RANGE = (1, 99)
+PUSH_BIAS = 0.6
+
+
+def level_params(level, capacity=None, length=None, fault_rate=None, rng=random):
+    params = NUMERICAL_PARAMS.get(level, NUMERICAL_PARAMS["Level 1"])
+    if capacity is None:
+        capacity = rng.randint(*params["capacity"])
+    if length is None:
+        length = rng.randint(*params["length"])
+    if fault_rate is None:
+        fault_rate = params["fault_rate"]
+    if capacity < 1 or length < 1:
+        raise ValueError("capacity and length must be positive")
+    return capacity, length, fault_rate
+
+def random_program(table, push_ops, pop_ops, capacity, length, fault_rate=0.0, rng=random):
+    """Draw ``length`` steps that keep the buffer valid except for injected overflows/underflows.
+
+    Returns compiled ``(handler, arg, text)`` steps ready for ``run_program`` without re-parsing.
+    """
+    program = []
+    size = 0
+    low, high = VALUE_RANGE
+    for _ in range(length):
+        if size == 0:
+            push = rng.random() >= fault_rate
+        elif size == capacity:
+            push = rng.random() < fault_rate
+        else:
+            push = rng.random() < PUSH_BIAS
+        if push:
+            name = push_ops[0] if len(push_ops) == 1 else rng.choice(push_ops)
+            value = rng.randint(low, high)
+            program.append((table[name][0], value, f"{name}({value})"))
+            size = min(size + 1, capacity)
+        else:
+            name = pop_ops[0] if len(pop_ops) == 1 else rng.choice(pop_ops)
+            program.append((table[name][0], None, f"{name}()"))
+            size = max(size - 1, 0)
+    return program
+
+def circular_queue_question(level, rng=random, capacity=None, length=None, fault_rate=None):
+    capacity, length, fault_rate = level_params(level, capacity, length, fault_rate, rng)
+    program = random_program(CIRCULAR_QUEUE_OPS, ("ENQUEUE",), ("DEQUEUE",), capacity, length, fault_rate, rng)
+    cq = CircularQueue(capacity)
+    explanation = Explanation(render_trace, run_program(program, cq))
+    ops = ', '.join(text for _, _, text in program)
+    question = f"A circular queue of size {capacity} undergoes the following operations:\n{ops}\nWhat will be the front and rear indices and the state of the queue?"
+    answer = f"Front Index: {cq.front}, Rear Index: {cq.rear}, Queue State: {cq.slots}"
+    return question, answer, explanation
+
+def deque_question(level, rng=random, capacity=None, length=None, fault_rate=None):
+    capacity, length, fault_rate = level_params(level, capacity, length, fault_rate, rng)
+    program = random_program(
+        RING_DEQUE_OPS, ("append", "appendleft"), ("pop", "popleft"), capacity, length, fault_rate, rng
+    )
+    rd = RingDeque(capacity)
+    explanation = Explanation(render_trace, run_program(program, rd))
+    ops = ', '.join(text for _, _, text in program)
+    question = f"A deque is stored in an array of size {capacity} as a circular buffer (front starts at index 0). Perform the following operations:\n{ops}\nWhat is the final state of the deque and where are its front and rear?"
+    answer = f"Deque State: {rd.items()}, Front Index: {rd.front}, Rear Index: {rd.rear}"
+    return question, answer, explanation
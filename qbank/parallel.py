@@ -0,0 +1,206 @@
+"""Process-pool bulk generation with reproducible per-shard seeds.
+
+A request is cut into shards of a fixed size.  Shard ``i`` always gets the
+seed ``derive_seed(master_seed, i)`` and shard results are merged in shard
+order, so the output for a given master seed is the same whatever the number
+of workers; with one worker the shards run lazily in this process.  Uniqueness
+is enforced while merging: duplicates across shards are dropped and extra
+shards top the output up to the requested count.  :func:`iter_parallel_lines`
+also serializes in the workers, so the parent only claims and writes lines.
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+from . import BANKS, metrics
+from .dedup import claim_unseen, question_digest
+from .errors import CapacityError
+from .export import dumps_question
+from .seeding import derive_seed, new_seed
+
+SHARD_SIZE = 5_000
+# Consecutive top-up shards allowed to add nothing new before giving up.
+MAX_DRY_SHARDS = 3
+
+
+def generate_shard(bank, subtopic, level, question_type, count, seed):
+    return BANKS[bank].generate_questions(subtopic, level, question_type, count, set(), seed)
+
+
+def generate_lines(bank, subtopic, level, question_type, count, seed, questions_only=False, stamp=None):
+    """Generate and serialize in the worker; returns ``(question text, JSON line)`` pairs.
+
+    ``stamp`` replaces the seed stamped on each question (bulk shards stamp the master seed).
+    """
+    questions = generate_shard(bank, subtopic, level, question_type, count, seed)
+    if stamp is not None:
+        for q in questions:
+            q["seed"] = stamp
+    return [(q["question"], dumps_question(q, questions_only)) for q in questions]
+
+
+class _InlineShard:
+    """Future-like shard that runs in this process when its result is first needed."""
+
+    __slots__ = ("fn", "args")
+
+    def __init__(self, fn, args):
+        self.fn = fn
+        self.args = args
+
+    def result(self):
+        return self.fn(*self.args)
+
+    def cancel(self):
+        return True
+
+
+class _InlineExecutor:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def submit(self, fn, *args):
+        return _InlineShard(fn, args)
+
+
+class _DigestSet:
+    """In-memory used set that stores 16-byte digests instead of question text."""
+
+    def __init__(self):
+        self._seen = set()
+
+    def __len__(self):
+        return len(self._seen)
+
+    def __contains__(self, key):
+        return question_digest(key) in self._seen
+
+    def add(self, key):
+        self._seen.add(question_digest(key))
+
+
+class ShardMerge:
+    """Shard plan and in-order merge shared by the process-pool and asyncio drivers.
+
+    A driver submits the shards :meth:`next_shard` hands out, passes each shard's
+    questions to :meth:`merge` strictly in shard order, and stops once ``done``.
+    ``merge`` drops questions already seen and anything past the target; when the
+    planned shards are used up, ``next_shard`` plans top-up shards sized to the deficit.
+    """
+
+    def __init__(self, bank, subtopic, level, count, seed, used_questions=None, shard_size=SHARD_SIZE):
+        self.subtopic = subtopic
+        self.level = level
+        self.seed = seed
+        self.used_questions = _DigestSet() if used_questions is None else used_questions
+        self.per_count = BANKS[bank].questions_per_count(subtopic)
+        self.target = count * self.per_count
+        self.produced = 0
+        self.in_flight = 0
+        self._planned = deque([shard_size] * (count // shard_size))
+        if count % shard_size:
+            self._planned.append(count % shard_size)
+        self._next_index = 0
+        self._dry_shards = 0
+
+    @property
+    def done(self):
+        return self.produced >= self.target
+
+    def next_shard(self):
+        """``(count, seed)`` of the next shard to submit, or None while nothing more is needed yet."""
+        if not self._planned:
+            if self.in_flight or self.done:
+                return None
+            # Duplicates were dropped across shards: top up with a shard sized to the deficit.
+            if self._dry_shards >= MAX_DRY_SHARDS:
+                raise CapacityError(
+                    f"no unseen questions left after {self.produced} of {self.target} for {self.subtopic} / {self.level}"
+                )
+            self._planned.append(-(-(self.target - self.produced) // self.per_count))
+        shard_seed = derive_seed(self.seed, self._next_index)
+        self._next_index += 1
+        self.in_flight += 1
+        return self._planned.popleft(), shard_seed
+
+    def merge(self, batch, key=itemgetter("question")):
+        """The unseen items of the next shard in order; ``key`` gives an item's question text."""
+        self.in_flight -= 1
+        batch = batch[:self.target - self.produced]
+        fresh = claim_unseen(self.used_questions, [key(item) for item in batch])
+        new_items = [item for item, is_new in zip(batch, fresh) if is_new]
+        self._dry_shards = 0 if new_items else self._dry_shards + 1
+        self.produced += len(new_items)
+        return new_items
+
+
+def _iter_merged(shard_fn, extra_args, key, bank, subtopic, level, question_type, count, seed, workers,
+                 used_questions, shard_size):
+    """Run ``shard_fn(bank, subtopic, level, question_type, count, seed, *extra_args)``
+    per shard and yield the merged items; ``key`` gives an item's question text."""
+    shards = ShardMerge(bank, subtopic, level, count, seed, used_questions, shard_size)
+    # Inline shards record metrics directly; pool workers send theirs back with each shard.
+    recorded = metrics.enabled and workers > 1
+    if workers > 1:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=metrics.reset)
+    else:
+        executor = _InlineExecutor()
+    with executor as pool:
+        pending = deque()
+
+        def fill():
+            # Keep a bounded window of shards in flight; results are consumed strictly in shard order.
+            while len(pending) < 2 * workers:
+                shard = shards.next_shard()
+                if shard is None:
+                    return
+                args = (bank, subtopic, level, question_type, *shard, *extra_args)
+                if recorded:
+                    pending.append(pool.submit(metrics.call_recorded, shard_fn, *args))
+                else:
+                    pending.append(pool.submit(shard_fn, *args))
+
+        while not shards.done:
+            fill()
+            batch = pending.popleft().result()
+            if recorded:
+                batch, delta = batch
+                metrics.merge(delta)
+            fill()
+            yield from shards.merge(batch, key)
+
+        for future in pending:
+            future.cancel()
+
+
+def iter_parallel_questions(bank, subtopic, level, question_type, count, seed=None, workers=None,
+                            used_questions=None, shard_size=SHARD_SIZE):
+    """Yield the same questions as ``iter_questions`` would, generated on a process pool.
+
+    ``count`` has the bank's usual meaning (for Expression Evaluation one count
+    is three questions).  ``used_questions`` may be a set or a DedupStore; when
+    omitted, uniqueness is tracked for this call only.
+    """
+    if seed is None:
+        seed = new_seed()
+    workers = workers or os.cpu_count() or 1
+    for q in _iter_merged(generate_shard, (), itemgetter("question"), bank, subtopic, level, question_type,
+                          count, seed, workers, used_questions, shard_size):
+        # Stamp the master seed: together with the parameters it regenerates the whole batch.
+        q["seed"] = seed
+        yield q
+
+
+def iter_parallel_lines(bank, subtopic, level, question_type, count, seed=None, workers=None,
+                        used_questions=None, shard_size=SHARD_SIZE, questions_only=False):
+    """JSON lines of the questions :func:`iter_parallel_questions` yields, serialized in the workers."""
+    if seed is None:
+        seed = new_seed()
+    workers = workers or os.cpu_count() or 1
+    for _, line in _iter_merged(generate_lines, (questions_only, seed), itemgetter(0), bank, subtopic, level,
+                                question_type, count, seed, workers, used_questions, shard_size):
+        yield line
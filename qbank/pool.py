@@ -0,0 +1,255 @@
+"""Pre-generated question pools topped up by a background thread.
+
+A form submit used to generate its questions inside the Streamlit rerun, so its latency
+was that of the generator: milliseconds for templates, far more for verified Code
+Tracing, which runs every snippet. :class:`QuestionPools` keeps a queue of ready
+questions for each (bank, subtopic, level, question type), and a daemon thread refills
+any queue that drops below its low-water mark. :meth:`QuestionPools.take` pops from the
+queue and generates synchronously only what the queue cannot supply (a cold pool, or
+pooled questions that ``used_questions`` rejects).
+
+Requests that differ only in inputs their generator ignores (the question type of Code
+Tracing, the level of objective questions, ...) share one pool. Questions in a pool are
+distinct, and refills draw only questions not already queued; a pool whose question
+space runs out is marked exhausted until questions are taken. Pooled questions are
+claimed against the caller's ``used_questions`` only when taken, so a question nobody
+took is never recorded as issued. Each keeps the seed of the refill batch it came from.
+Seeded requests bypass the pools, so a seed still regenerates exactly that request.
+
+A refill that rejects its inputs (``ValueError``, ``LookupError``, ``TypeError``) marks
+the pool failed for good. Any other error, such as a verifier worker pool that broke,
+is retried after a delay that doubles with each consecutive failure.
+"""
+import heapq
+import itertools
+import os
+import threading
+import time
+from collections import deque
+
+from . import BANKS, metrics
+from .dedup import claim_unseen
+from .errors import CapacityError
+from .sandbox import SnippetRunner
+
+VERIFY_CODE_ENV = "QBANK_VERIFY_CODE"
+# Sizes in counts (one count is three Expression Evaluation questions). The apps request
+# at most 100 per submit, so a pool at its low-water mark still covers the largest submit.
+POOL_CAPACITY = 200
+POOL_LOW_WATER = 100
+# Counts generated per refill step; the refill thread moves on to the next pool between
+# steps, so one slow generator cannot starve the others.
+REFILL_BATCH = 50
+# Backoff in seconds after a refill fails with an error other than bad inputs.
+REFILL_RETRY_DELAY = 0.5
+REFILL_RETRY_MAX_DELAY = 60.0
+# The generators reject inputs they cannot serve with these; retrying cannot help.
+INPUT_ERRORS = (ValueError, LookupError, TypeError)
+
+
+class _Pool:
+    __slots__ = ("ready", "queued", "capacity", "low_water", "scheduled", "exhausted", "failed", "retries")
+
+    def __init__(self, capacity, low_water):
+        self.ready = deque()
+        self.queued = set()  # question text of everything in ready
+        self.capacity = capacity
+        self.low_water = low_water
+        self.scheduled = False
+        # The last refill ran out of unqueued questions; cleared when questions are taken.
+        self.exhausted = False
+        # Generation rejected the pool's inputs; take() then generates directly, which
+        # surfaces the error. The inputs are fixed, so this is permanent.
+        self.failed = False
+        # Consecutive refills that failed with any other error; each doubles the backoff.
+        self.retries = 0
+
+
+class QuestionPools:
+    """Ready-made questions per generator input; call :meth:`close` when done.
+
+    Pools are created on first use or up front with :meth:`warm`. ``verifier`` (a
+    :class:`qbank.sandbox.SnippetRunner`) checks stack Code Tracing answers, in the
+    refill thread as well as on direct generation.
+    """
+
+    def __init__(self, capacity=POOL_CAPACITY, low_water=POOL_LOW_WATER, refill_batch=REFILL_BATCH, verifier=None):
+        if not 0 <= low_water <= capacity or refill_batch < 1:
+            raise ValueError("need 0 <= low_water <= capacity and refill_batch >= 1")
+        self.capacity = capacity
+        self.low_water = low_water
+        self.refill_batch = refill_batch
+        self.verifier = verifier
+        self._pools = {}
+        self._needy = deque()
+        self._backoff = []  # heap of (monotonic retry time, key) for pools after a failed refill
+        self._cond = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._refill_loop, name="qbank-pool-refill", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def sizes(self):
+        """Ready questions per pool key."""
+        with self._cond:
+            return {key: len(pool.ready) for key, pool in self._pools.items()}
+
+    def idle(self):
+        """True when no pool is waiting for a refill."""
+        with self._cond:
+            return not self._needy and not any(pool.scheduled for pool in self._pools.values())
+
+    @staticmethod
+    def pool_key(bank, subtopic, level, question_type):
+        return (bank, *BANKS[bank].generation_inputs(subtopic, level, question_type))
+
+    def warm(self, bank):
+        """Create and start filling a pool for every distinct generator input of ``bank``."""
+        module = BANKS[bank]
+        keys = dict.fromkeys(
+            self.pool_key(bank, *inputs)
+            for inputs in itertools.product(module.subtopics, module.levels, module.question_types)
+        )
+        with self._cond:
+            for key in keys:
+                self._schedule(key, self._get_pool(key))
+
+    def take(self, bank, subtopic, level, question_type, count, used_questions=None, seed=None):
+        """Same result shape as ``generate_questions``, served from the pool where possible.
+
+        The questions of one call are distinct, as with ``generate_questions``.
+        """
+        if seed is not None:
+            return self._generate((bank, subtopic, level, question_type), count, used_questions, seed)
+        key = self.pool_key(bank, subtopic, level, question_type)
+        per_count = BANKS[bank].questions_per_count(subtopic)
+        target = count * per_count
+        taken = []
+        with self._cond:
+            pool = self._get_pool(key)
+            while pool.ready and len(taken) < target:
+                q = pool.ready.popleft()
+                pool.queued.discard(q["question"])
+                taken.append(q)
+            if taken:
+                pool.exhausted = False
+            if len(pool.ready) < pool.low_water:
+                self._schedule(key, pool)
+        if used_questions is not None and taken:
+            fresh = claim_unseen(used_questions, [q["question"] for q in taken])
+            taken = [q for q, is_new in zip(taken, fresh) if is_new]
+        pooled = len(taken)
+        if pooled < target:
+            # Without a caller's used set, the direct batch must still avoid what the pool supplied.
+            used = used_questions if used_questions is not None else {q["question"] for q in taken}
+            taken.extend(self._generate(key, -(-(target - pooled) // per_count), used, None)[:target - pooled])
+        if metrics.enabled:
+            metrics.inc("qbank_pool_questions_total", pooled, bank=bank, source="pool")
+            metrics.inc("qbank_pool_questions_total", len(taken) - pooled, bank=bank, source="direct")
+        return taken
+
+    # ----- internals; _get_pool and _schedule need the lock held -----
+    def _get_pool(self, key):
+        pool = self._pools.get(key)
+        if pool is None:
+            per_count = BANKS[key[0]].questions_per_count(key[1])
+            pool = self._pools[key] = _Pool(self.capacity * per_count, self.low_water * per_count)
+        return pool
+
+    def _schedule(self, key, pool):
+        if not (pool.scheduled or pool.exhausted or pool.failed or self._closed):
+            pool.scheduled = True
+            self._needy.append(key)
+            self._cond.notify()
+
+    def _verifier_kwargs(self, bank, subtopic):
+        if self.verifier is not None and bank == "stack" and subtopic == "Code Tracing":
+            return {"verifier": self.verifier}
+        return {}
+
+    def _generate(self, key, count, used_questions, seed):
+        bank, subtopic, level, question_type = key
+        return BANKS[bank].generate_questions(
+            subtopic, level, question_type, count, used_questions, seed, **self._verifier_kwargs(bank, subtopic)
+        )
+
+    def _refill(self, key, missing, queued):
+        """Up to ``missing`` questions not in ``queued``; returns ``(questions, exhausted)``."""
+        bank, subtopic, level, question_type = key
+        module = BANKS[bank]
+        count = min(self.refill_batch, -(-missing // module.questions_per_count(subtopic)))
+        distinct = module.distinct_questions(subtopic, level, question_type)
+        if distinct is not None:
+            # Template spaces are enumerable: never ask for more than is left unqueued.
+            count = min(count, distinct - len(queued))
+            if count <= 0:
+                return [], True
+        batch = []
+        try:
+            batch.extend(module.iter_questions(
+                subtopic, level, question_type, count, queued, None, **self._verifier_kwargs(bank, subtopic)
+            ))
+        except CapacityError:
+            return batch, True
+        return batch, False
+
+    def _refill_loop(self):
+        while True:
+            with self._cond:
+                while not self._closed:
+                    now = time.monotonic()
+                    while self._backoff and self._backoff[0][0] <= now:
+                        self._needy.append(heapq.heappop(self._backoff)[1])
+                    if self._needy:
+                        break
+                    self._cond.wait(self._backoff[0][0] - now if self._backoff else None)
+                if self._closed:
+                    return
+                key = self._needy.popleft()
+                pool = self._pools[key]
+                missing = pool.capacity - len(pool.ready)
+                queued = set(pool.queued)
+            batch, exhausted, failed, transient = [], False, False, False
+            if missing > 0:
+                try:
+                    batch, exhausted = self._refill(key, missing, queued)
+                except INPUT_ERRORS:  # an input combination the generator cannot serve
+                    failed = True
+                except Exception:
+                    transient = True
+            with self._cond:
+                for q in batch:
+                    # A take() may have popped and a refill re-queued the same text meanwhile.
+                    if q["question"] not in pool.queued:
+                        pool.queued.add(q["question"])
+                        pool.ready.append(q)
+                if transient:
+                    # Stays scheduled, so take() does not queue it again before the delay is up.
+                    delay = min(REFILL_RETRY_DELAY * 2 ** pool.retries, REFILL_RETRY_MAX_DELAY)
+                    pool.retries += 1
+                    heapq.heappush(self._backoff, (time.monotonic() + delay, key))
+                    continue
+                pool.retries = 0
+                pool.scheduled = False
+                pool.failed = pool.failed or failed
+                pool.exhausted = exhausted
+                # Keep going round-robin until the pool is full again.
+                if len(pool.ready) < pool.capacity:
+                    self._schedule(key, pool)
+
+
+def open_default_pools():
+    """Pools that verify Code Tracing answers when ``QBANK_VERIFY_CODE`` is set."""
+    verify = os.environ.get(VERIFY_CODE_ENV, "") not in ("", "0")
+    return QuestionPools(verifier=SnippetRunner() if verify else None)
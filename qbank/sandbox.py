@@ -0,0 +1,271 @@
+"""Run generated code snippets in worker processes and check what they print.
+
+Code Tracing answers come from hand-written ``answer_fn``s that mirror each template.
+:class:`SnippetRunner` executes the formatted code itself in a pool of worker
+processes, each under an address-space limit, with a per-snippet time limit and a cap
+on captured output, and reports what the code printed. Results are cached by a digest
+of the code, so repeated snippets run once per process.
+
+The time limit is a ``SIGALRM`` in the worker, which cannot interrupt a snippet stuck
+inside C code, so the parent also gives every chunk a deadline and kills the pool's
+workers when it passes. Workers start from a forkserver (spawn where there is none)
+rather than a fork of a possibly multi-threaded parent.
+
+The workers isolate the generating process from crashes, hangs and memory blow-ups, and
+snippets may only import the modules in ``SNIPPET_IMPORTS``; they still share a worker
+with earlier snippets, so this is meant for the repo's own templates, not for untrusted
+code.
+"""
+import builtins
+import contextlib
+import io
+import multiprocessing
+import os
+import signal
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from . import metrics
+from .dedup import question_digest
+from .memo import LRUCache
+
+try:
+    import resource
+except ImportError:  # Windows: no address-space limit.
+    resource = None
+
+SNIPPET_TIMEOUT = 1.0
+# Address space a worker may grow by beyond what it holds at start-up; forked workers
+# inherit the parent's mappings, so an absolute limit would fail under a large parent.
+SNIPPET_MEMORY_LIMIT = 512 * 1024 * 1024
+SNIPPET_OUTPUT_LIMIT = 64 * 1024
+# Snippets are sent to the workers in chunks of this many to amortize IPC.
+SNIPPET_CHUNK = 256
+SNIPPET_CACHE_SIZE = 65536
+# Parent-side slack on top of the per-snippet limits before a chunk's workers are killed.
+SNIPPET_KILL_GRACE = 5.0
+# Top-level modules the templates' snippets import.
+SNIPPET_IMPORTS = frozenset({"collections"})
+
+SnippetResult = namedtuple("SnippetResult", "ok stdout error")
+
+# Results keyed on the code digest, shared by every runner in the process.
+snippet_cache = LRUCache(SNIPPET_CACHE_SIZE)
+metrics.register_cache("snippet", snippet_cache)
+
+
+# ----- WORKER SIDE -----
+class SnippetTimeout(Exception):
+    pass
+
+
+class _BoundedOutput(io.StringIO):
+    def write(self, text):
+        if self.tell() + len(text) > SNIPPET_OUTPUT_LIMIT:
+            raise RuntimeError(f"snippet printed more than {SNIPPET_OUTPUT_LIMIT} characters")
+        return super().write(text)
+
+
+def _on_timeout(signum, frame):
+    raise SnippetTimeout("snippet ran longer than its time limit")
+
+
+def _snippet_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level or name.partition(".")[0] not in SNIPPET_IMPORTS:
+        raise ImportError(f"snippets may not import {name!r}")
+    return __import__(name, globals, locals, fromlist, level)
+
+
+_SNIPPET_BUILTINS = dict(vars(builtins), __import__=_snippet_import)
+
+
+def _address_space_in_use():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):  # no procfs: the budget becomes an absolute limit
+        return 0
+
+
+def _init_worker(memory_limit):
+    if resource is not None and memory_limit:
+        limit = _address_space_in_use() + memory_limit
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if hasattr(signal, "setitimer"):
+        signal.signal(signal.SIGALRM, _on_timeout)
+
+
+def run_chunk(codes, timeout=SNIPPET_TIMEOUT):
+    """Execute each snippet in a fresh namespace; returns one ``(ok, stdout, error)`` per snippet."""
+    timed = hasattr(signal, "setitimer")
+    results = []
+    for code in codes:
+        out = _BoundedOutput()
+        try:
+            compiled = compile(code, "<snippet>", "exec")
+            with contextlib.redirect_stdout(out):
+                if timed:
+                    signal.setitimer(signal.ITIMER_REAL, timeout)
+                try:
+                    exec(compiled, {"__name__": "__snippet__", "__builtins__": _SNIPPET_BUILTINS})
+                finally:
+                    if timed:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+        except BaseException as exc:  # SystemExit and MemoryError are failures like any other.
+            results.append((False, out.getvalue(), f"{type(exc).__name__}: {exc}"))
+        else:
+            results.append((True, out.getvalue(), None))
+    return results
+
+
+# ----- PARENT SIDE -----
+def _worker_context():
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+class SnippetRunner:
+    """A pool of snippet workers; use as a context manager or call :meth:`close`.
+
+    One runner may be shared by several threads; the pool is created and replaced under a lock.
+    A chunk still running ``timeout * len(chunk) + kill_grace`` seconds after the parent
+    starts waiting for it has its pool's workers killed, and its snippets are rerun singly.
+    """
+
+    def __init__(self, workers=None, timeout=SNIPPET_TIMEOUT, memory_limit=SNIPPET_MEMORY_LIMIT,
+                 cache=snippet_cache, chunk_size=SNIPPET_CHUNK, kill_grace=SNIPPET_KILL_GRACE):
+        self.workers = workers or os.cpu_count() or 1
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.cache = cache
+        self.chunk_size = chunk_size
+        self.kill_grace = kill_grace
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    self.workers, mp_context=_worker_context(),
+                    initializer=_init_worker, initargs=(self.memory_limit,),
+                )
+            return self._pool
+
+    def _restart(self, broken):
+        """Drop ``broken`` unless another thread has already replaced it."""
+        with self._lock:
+            if self._pool is not broken:
+                return
+            self._pool = None
+        broken.shutdown(wait=True, cancel_futures=True)
+
+    def _kill(self, pool):
+        """Kill the workers of a pool with a hung snippet; its pending futures fail as broken."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        # The executor has no public way to stop a running task.
+        for process in list((getattr(pool, "_processes", None) or {}).values()):
+            process.kill()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    def _deadline(self, count):
+        return self.timeout * count + self.kill_grace
+
+    def run(self, codes):
+        """Return a :class:`SnippetResult` per snippet, running only the ones not cached."""
+        keys = [question_digest(code) for code in codes]
+        found = {}
+        missing = {}
+        for key, code in zip(keys, codes):
+            if key in found or key in missing:
+                continue
+            result = self.cache.get(key) if self.cache is not None else None
+            if result is None:
+                missing[key] = code
+            else:
+                found[key] = result
+        if missing:
+            for key, result in zip(missing, self._execute(list(missing.values()))):
+                found[key] = result
+                # A timeout may depend on load, so only deterministic outcomes are kept.
+                if self.cache is not None and not (result.error or "").startswith("SnippetTimeout"):
+                    self.cache.put(key, result)
+        return [found[key] for key in keys]
+
+    def _execute(self, codes):
+        chunks = [codes[i:i + self.chunk_size] for i in range(0, len(codes), self.chunk_size)]
+        pool = self._get_pool()
+        futures = []
+        for chunk in chunks:
+            try:
+                futures.append(pool.submit(run_chunk, chunk, self.timeout))
+            except BrokenProcessPool:  # broken by another thread's snippet
+                futures.append(None)
+        results = []
+        for chunk, future in zip(chunks, futures):
+            batch = None
+            if future is not None:
+                try:
+                    batch = future.result(timeout=self._deadline(len(chunk)))
+                except BrokenProcessPool:
+                    pass
+                except TimeoutError:
+                    self._kill(pool)
+            if batch is None:
+                # A snippet took its worker down or hung it, and every unfinished chunk
+                # went with it; rerun those one snippet at a time to find the culprit.
+                results.extend(self._execute_singly(chunk))
+            else:
+                results.extend(SnippetResult(*r) for r in batch)
+        return results
+
+    def _execute_singly(self, codes):
+        results = []
+        for code in codes:
+            # The first failure may just be the pool left broken by an earlier snippet.
+            for _ in range(2):
+                pool = self._get_pool()
+                try:
+                    future = pool.submit(run_chunk, [code], self.timeout)
+                    result = SnippetResult(*future.result(timeout=self._deadline(1))[0])
+                    break
+                except BrokenProcessPool:
+                    self._restart(pool)
+                except TimeoutError:
+                    self._kill(pool)
+                    result = SnippetResult(False, "", "SnippetTimeout: the snippet hung its worker and was killed")
+                    break
+            else:
+                result = SnippetResult(False, "", "BrokenProcessPool: the snippet killed its worker")
+            results.append(result)
+        return results
+
+    def verify(self, pairs):
+        """For ``(code, expected stdout)`` pairs, return True where the code ran and printed that text.
+
+        Trailing whitespace is ignored, so ``print(x, end=' ')`` loops compare cleanly.
+        """
+        results = self.run([code for code, _ in pairs])
+        return [
+            result.ok and result.stdout.rstrip() == expected.rstrip()
+            for result, (_, expected) in zip(results, pairs)
+        ]
@@ -0,0 +1,270 @@
+"""Discrete-event CPU scheduling simulator for scheduling numericals.
+
+Jobs are ``Job(name, arrival, burst, priority)`` tuples; a lower priority number runs
+first. The heap-based policies reschedule only on arrivals and completions, so FCFS,
+SJF, SRTF and preemptive priority are O(n log n). Round Robin and MLFQ are linear in
+the number of time slices.
+"""
+import heapq
+import random
+from collections import deque, namedtuple
+
+from .explain import Explanation
+
+Job = namedtuple("Job", "name arrival burst priority")
+
+IDLE = "idle"
+MLFQ_QUANTA = (2, 4)
+ALGORITHMS = {
+    "FCFS": "First Come First Serve",
+    "SJF": "non-preemptive Shortest Job First",
+    "SRTF": "Shortest Remaining Time First",
+    "RR": "Round Robin",
+    "PRIORITY": "preemptive Priority scheduling (lower number = higher priority)",
+    "MLFQ": "a Multilevel Feedback Queue",
+}
+SCHEDULING_PARAMS = {
+    "Level 1": {"algorithms": ("FCFS", "SJF"), "jobs": (3, 4), "burst": (1, 8)},
+    "Level 2": {"algorithms": ("SJF", "SRTF", "RR"), "jobs": (4, 5), "burst": (1, 9)},
+    "Level 3": {"algorithms": ("SRTF", "RR", "MLFQ"), "jobs": (5, 6), "burst": (2, 10)},
+}
+PRIORITY_RANGE = (1, 5)
+
+
+class Schedule:
+    """Per-job start/finish times and merged Gantt segments ``[name, start, end]``."""
+
+    __slots__ = ("algorithm", "jobs", "start", "finish", "gantt")
+
+    def __init__(self, algorithm, jobs):
+        self.algorithm = algorithm
+        self.jobs = jobs
+        self.start = [None] * len(jobs)
+        self.finish = [None] * len(jobs)
+        self.gantt = []
+
+    def run(self, name, start, end):
+        last = self.gantt[-1] if self.gantt else None
+        if last is not None and last[0] == name and last[2] == start:
+            last[2] = end
+        else:
+            self.gantt.append([name, start, end])
+
+    def turnaround(self, i):
+        return self.finish[i] - self.jobs[i].arrival
+
+    def waiting(self, i):
+        return self.turnaround(i) - self.jobs[i].burst
+
+    def averages(self):
+        n = len(self.jobs)
+        return (
+            sum(self.waiting(i) for i in range(n)) / n,
+            sum(self.turnaround(i) for i in range(n)) / n,
+        )
+
+
+# ----- POLICIES -----
+def _arrival_order(jobs):
+    return sorted(range(len(jobs)), key=lambda i: (jobs[i].arrival, i))
+
+def fcfs(jobs):
+    schedule = Schedule("FCFS", jobs)
+    t = 0
+    for i in _arrival_order(jobs):
+        job = jobs[i]
+        if job.arrival > t:
+            schedule.run(IDLE, t, job.arrival)
+            t = job.arrival
+        schedule.start[i] = t
+        schedule.run(job.name, t, t + job.burst)
+        t += job.burst
+        schedule.finish[i] = t
+    return schedule
+
+def _heap_schedule(algorithm, jobs, key, preemptive):
+    """Run the ready job with the smallest ``key(i, remaining)``; ties go to the earlier arrival.
+
+    Preemptive policies only reconsider the choice when a job arrives.
+    """
+    schedule = Schedule(algorithm, jobs)
+    order = _arrival_order(jobs)
+    remaining = [job.burst for job in jobs]
+    ready = []
+    t = k = 0
+    n = len(jobs)
+    while k < n or ready:
+        if not ready and jobs[order[k]].arrival > t:
+            schedule.run(IDLE, t, jobs[order[k]].arrival)
+            t = jobs[order[k]].arrival
+        while k < n and jobs[order[k]].arrival <= t:
+            i = order[k]
+            heapq.heappush(ready, (key(i, remaining), jobs[i].arrival, i))
+            k += 1
+        _, _, i = heapq.heappop(ready)
+        if schedule.start[i] is None:
+            schedule.start[i] = t
+        run = remaining[i]
+        if preemptive and k < n:
+            run = min(run, jobs[order[k]].arrival - t)
+        schedule.run(jobs[i].name, t, t + run)
+        t += run
+        remaining[i] -= run
+        if remaining[i]:
+            heapq.heappush(ready, (key(i, remaining), jobs[i].arrival, i))
+        else:
+            schedule.finish[i] = t
+    return schedule
+
+def sjf(jobs):
+    return _heap_schedule("SJF", jobs, lambda i, remaining: jobs[i].burst, preemptive=False)
+
+def srtf(jobs):
+    return _heap_schedule("SRTF", jobs, lambda i, remaining: remaining[i], preemptive=True)
+
+def priority(jobs):
+    return _heap_schedule("PRIORITY", jobs, lambda i, remaining: jobs[i].priority, preemptive=True)
+
+def round_robin(jobs, quantum=2):
+    """Jobs arriving during a slice join the queue before the preempted job is re-queued."""
+    schedule = Schedule("RR", jobs)
+    order = _arrival_order(jobs)
+    remaining = [job.burst for job in jobs]
+    ready = deque()
+    t = k = 0
+    n = len(jobs)
+    while k < n or ready:
+        if not ready and jobs[order[k]].arrival > t:
+            schedule.run(IDLE, t, jobs[order[k]].arrival)
+            t = jobs[order[k]].arrival
+        while k < n and jobs[order[k]].arrival <= t:
+            ready.append(order[k])
+            k += 1
+        i = ready.popleft()
+        if schedule.start[i] is None:
+            schedule.start[i] = t
+        run = min(quantum, remaining[i])
+        schedule.run(jobs[i].name, t, t + run)
+        t += run
+        remaining[i] -= run
+        while k < n and jobs[order[k]].arrival <= t:
+            ready.append(order[k])
+            k += 1
+        if remaining[i]:
+            ready.append(i)
+        else:
+            schedule.finish[i] = t
+    return schedule
+
+def mlfq(jobs, quanta=MLFQ_QUANTA):
+    """Round Robin queues with ``quanta`` above a final FCFS queue.
+
+    New jobs enter the top queue. A job that uses its whole quantum drops one level.
+    An arrival preempts a job running below the top level, which then goes to the
+    back of its own queue without being demoted.
+    """
+    schedule = Schedule("MLFQ", jobs)
+    order = _arrival_order(jobs)
+    remaining = [job.burst for job in jobs]
+    queues = [deque() for _ in range(len(quanta) + 1)]
+    t = k = 0
+    n = len(jobs)
+    while k < n or any(queues):
+        if not any(queues) and jobs[order[k]].arrival > t:
+            schedule.run(IDLE, t, jobs[order[k]].arrival)
+            t = jobs[order[k]].arrival
+        while k < n and jobs[order[k]].arrival <= t:
+            queues[0].append(order[k])
+            k += 1
+        level = next(lvl for lvl, queue in enumerate(queues) if queue)
+        i = queues[level].popleft()
+        if schedule.start[i] is None:
+            schedule.start[i] = t
+        quantum = quanta[level] if level < len(quanta) else remaining[i]
+        run = min(quantum, remaining[i])
+        if level and k < n:
+            run = min(run, jobs[order[k]].arrival - t)
+        schedule.run(jobs[i].name, t, t + run)
+        t += run
+        remaining[i] -= run
+        while k < n and jobs[order[k]].arrival <= t:
+            queues[0].append(order[k])
+            k += 1
+        if not remaining[i]:
+            schedule.finish[i] = t
+        elif run == quantum:
+            queues[min(level + 1, len(quanta))].append(i)
+        else:
+            queues[level].append(i)
+    return schedule
+
+def simulate(algorithm, jobs, quantum=2):
+    if algorithm == "FCFS":
+        return fcfs(jobs)
+    if algorithm == "SJF":
+        return sjf(jobs)
+    if algorithm == "SRTF":
+        return srtf(jobs)
+    if algorithm == "RR":
+        return round_robin(jobs, quantum)
+    if algorithm == "PRIORITY":
+        return priority(jobs)
+    if algorithm == "MLFQ":
+        return mlfq(jobs)
+    raise ValueError(f"Unknown scheduling algorithm {algorithm!r}; expected one of {list(ALGORITHMS)}")
+
+
+# ----- QUESTIONS -----
+def random_jobs(n, burst=(1, 10), rng=random):
+    """``n`` jobs with the first arriving at 0 and later arrivals spread over about half the total work."""
+    low, high = burst
+    horizon = max(1, n * (low + high) // 4)
+    arrivals = sorted([0] + [rng.randint(0, horizon) for _ in range(n - 1)])
+    return [
+        Job(f"P{i + 1}", arrival, rng.randint(low, high), rng.randint(*PRIORITY_RANGE))
+        for i, arrival in enumerate(arrivals)
+    ]
+
+def format_gantt(schedule):
+    return ' '.join(f"| {name} {start}-{end}" for name, start, end in schedule.gantt) + " |"
+
+def explain_schedule(schedule):
+    explanation = [
+        f"Time {start}-{end}: {'CPU idle' if name == IDLE else 'run ' + name}" for name, start, end in schedule.gantt
+    ]
+    for i, job in enumerate(schedule.jobs):
+        explanation.append(
+            f"{job.name}: Turnaround = {schedule.finish[i]} - {job.arrival} = {schedule.turnaround(i)}, "
+            f"Waiting = {schedule.turnaround(i)} - {job.burst} = {schedule.waiting(i)}"
+        )
+    return explanation
+
+def scheduling_question(level, rng=random, algorithm=None, jobs=None, quantum=2):
+    params = SCHEDULING_PARAMS.get(level, SCHEDULING_PARAMS["Level 1"])
+    if algorithm is None:
+        algorithm = rng.choice(params["algorithms"])
+    if jobs is None:
+        jobs = random_jobs(rng.randint(*params["jobs"]), params["burst"], rng)
+    schedule = simulate(algorithm, jobs, quantum)
+
+    show_priority = algorithm == "PRIORITY"
+    job_lines = '\n'.join(
+        f"{job.name}: arrival {job.arrival}, burst {job.burst}" + (f", priority {job.priority}" if show_priority else "")
+        for job in jobs
+    )
+    policy = ALGORITHMS[algorithm]
+    if algorithm == "RR":
+        policy += f" with time quantum {quantum}"
+    elif algorithm == "MLFQ":
+        policy += f" (quanta {', '.join(map(str, MLFQ_QUANTA))}, then FCFS; a full quantum demotes a job)"
+    question = f"Schedule the following processes using {policy}:\n{job_lines}\nReport the start, finish, waiting and turnaround time of each process and draw the Gantt chart."
+
+    rows = [
+        f"{job.name}: Start {schedule.start[i]}, Finish {schedule.finish[i]}, "
+        f"Waiting {schedule.waiting(i)}, Turnaround {schedule.turnaround(i)}"
+        for i, job in enumerate(jobs)
+    ]
+    avg_waiting, avg_turnaround = schedule.averages()
+    rows.append(f"Average Waiting: {avg_waiting:.2f}, Average Turnaround: {avg_turnaround:.2f}")
+    rows.append(f"Gantt: {format_gantt(schedule)}")
+    return question, '\n'.join(rows), Explanation(explain_schedule, schedule)
@@ -0,0 +1,31 @@
+"""Seeds and per-call random generators.
+
+Generators never touch the global ``random`` state when given an ``rng``; the
+bank-level entry points create one ``random.Random`` per call from a seed and
+stamp that seed on every question, so a bank can be regenerated from
+(seed, parameters) alone.
+"""
+import hashlib
+import random
+
+SEED_BITS = 63
+_system_random = random.SystemRandom()
+
+
+def new_seed():
+    return _system_random.getrandbits(SEED_BITS)
+
+
+def derive_seed(master_seed, index):
+    digest = hashlib.blake2b(f"{master_seed}:{index}".encode("ascii"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> (64 - SEED_BITS)
+
+
+def make_rng(seed):
+    return random.Random(seed)
+
+
+def stamp_seed(questions, seed):
+    for q in questions:
+        q["seed"] = seed
+        yield q
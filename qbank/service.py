@@ -0,0 +1,452 @@
+"""Asyncio HTTP service over the question banks, built on the standard library only.
+
+Run it with::
+
+    python -m qbank.service --port 8765 --workers 4
+
+Endpoints (parameters as a JSON body or a query string; ``bank``, ``subtopic``,
+``level``, ``type``, ``count``, ``seed``, ``questions_only``):
+
+``GET /health``
+    Liveness plus current load.
+``GET|POST /generate``
+    Up to ``MAX_GENERATE_COUNT`` questions as ``{"questions": [...]}``.
+``GET|POST /bulk-generate``
+    Any number of questions streamed as chunked NDJSON. With the same seed the lines
+    match ``python -m qbank --workers N``. A failure after streaming has started ends
+    the stream with an ``{"error": ...}`` line.
+``GET /metrics``
+    Prometheus text when :mod:`qbank.metrics` is enabled, ``404`` otherwise.
+
+Generation and serialization run on a process pool, so the event loop only parses
+requests and copies bytes. Concurrent small unseeded ``/generate`` requests for the
+same parameters are coalesced into one pool job and split afterwards; seeded requests
+run alone so they stay reproducible. When the pool backlog, the number of open
+connections or the number of bulk streams reaches its limit, new work is refused with
+``503`` and ``Retry-After`` instead of queueing without bound.
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+from urllib.parse import parse_qsl, urlsplit
+
+from . import BANKS, metrics
+from .errors import CapacityError
+from .parallel import ShardMerge, generate_lines
+from .seeding import new_seed
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_GENERATE_COUNT = 1000
+MAX_BULK_COUNT = 10_000_000
+# Unseeded /generate requests up to this count share pool jobs with concurrent requests
+# for the same parameters; a shared job waits at most COALESCE_WINDOW seconds for
+# companions and is sent early once it holds COALESCE_BATCH_MAX counts.
+COALESCE_MAX_COUNT = 50
+COALESCE_WINDOW = 0.002
+COALESCE_BATCH_MAX = 1000
+# Backpressure limits.
+MAX_PENDING_JOBS = 256
+MAX_CONNECTIONS = 1024
+MAX_BULK_STREAMS = 4
+MAX_BODY_BYTES = 64 * 1024
+# Longer request or header lines overrun the StreamReader buffer and get 414/431.
+MAX_LINE_BYTES = 64 * 1024
+MAX_HEADERS = 100
+KEEPALIVE_TIMEOUT = 30.0
+RETRY_AFTER_SECONDS = 1
+
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 409: "Conflict",
+    413: "Payload Too Large", 414: "URI Too Long", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ----- REQUESTS -----
+def parse_params(params):
+    """Validate request parameters; returns the job key, count and seed."""
+    bank_name = params.get("bank", "stack")
+    bank = BANKS.get(bank_name)
+    if bank is None:
+        raise HTTPError(400, f"unknown bank {bank_name!r}; choose from {sorted(BANKS)}")
+    subtopic = params.get("subtopic")
+    if subtopic not in bank.subtopics:
+        raise HTTPError(400, f"unknown subtopic {subtopic!r} for bank {bank_name!r}; choose from {bank.subtopics}")
+    level = params.get("level", "Level 1")
+    if level not in bank.levels:
+        raise HTTPError(400, f"unknown level {level!r}; choose from {bank.levels}")
+    question_type = params.get("type", "Long Answer")
+    if question_type not in bank.question_types:
+        raise HTTPError(400, f"unknown question type {question_type!r}; choose from {bank.question_types}")
+    try:
+        count = int(params.get("count", 10))
+        seed = params.get("seed")
+        seed = None if seed in (None, "") else int(seed)
+    except (TypeError, ValueError):
+        raise HTTPError(400, "count and seed must be whole numbers") from None
+    if count < 0:
+        raise HTTPError(400, "count must be non-negative")
+    questions_only = str(params.get("questions_only", "")).lower() in ("1", "true", "yes")
+    return (bank_name, subtopic, level, question_type, questions_only), count, seed
+
+async def read_head(reader):
+    """Read a request line and headers; returns ``(parts, headers)``, or None at end of stream."""
+    try:
+        request_line = await asyncio.wait_for(reader.readline(), KEEPALIVE_TIMEOUT)
+    except asyncio.TimeoutError:
+        return None
+    except ValueError:  # the line overran the reader's limit
+        raise HTTPError(414, f"request line longer than {MAX_LINE_BYTES} bytes") from None
+    if not request_line:
+        return None
+    headers = {}
+    while True:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            raise HTTPError(431, f"header line longer than {MAX_LINE_BYTES} bytes") from None
+        if line in (b"\r\n", b"\n", b""):
+            break
+        if len(headers) >= MAX_HEADERS:
+            raise HTTPError(431, f"more than {MAX_HEADERS} headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return request_line.decode("latin-1").split(), headers
+
+def read_params(method, query, body):
+    params = dict(parse_qsl(query))
+    if method == "POST" and body:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HTTPError(400, "request body must be a JSON object") from None
+        if not isinstance(payload, dict):
+            raise HTTPError(400, "request body must be a JSON object")
+        params.update(payload)
+    return params
+
+
+class _Batch:
+    __slots__ = ("waiters", "total")
+
+    def __init__(self):
+        self.waiters = []
+        self.total = 0
+
+
+# ----- SERVICE -----
+class QuestionService:
+    def __init__(self, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        # Spawned, not forked: a worker forked mid-request would inherit open client sockets
+        # and keep them alive after the service closes them.
+        self.pool = ProcessPoolExecutor(
+            self.workers, mp_context=multiprocessing.get_context("spawn"), initializer=metrics.reset
+        )
+        self.pending_jobs = 0
+        self.connections = 0
+        self.bulk_streams = 0
+        self._batches = {}
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    # ----- pool jobs -----
+    def overloaded(self):
+        return self.pending_jobs >= MAX_PENDING_JOBS
+
+    async def run_job(self, key, count, seed, stamp=None):
+        bank, subtopic, level, question_type, questions_only = key
+        args = (bank, subtopic, level, question_type, count, seed, questions_only, stamp)
+        recorded = metrics.enabled
+        self.pending_jobs += 1
+        try:
+            if not recorded:
+                return await asyncio.wrap_future(self.pool.submit(generate_lines, *args))
+            lines, delta = await asyncio.wrap_future(self.pool.submit(metrics.call_recorded, generate_lines, *args))
+            metrics.merge(delta)
+            return lines
+        finally:
+            self.pending_jobs -= 1
+
+    async def generate(self, key, count, seed):
+        """JSON lines for one /generate request, sharing a pool job when possible."""
+        if seed is not None or count > COALESCE_MAX_COUNT:
+            return [line for _, line in await self.run_job(key, count, seed)]
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = _Batch()
+            loop.call_later(COALESCE_WINDOW, self._dispatch, key, batch)
+        future = loop.create_future()
+        batch.waiters.append((count, future))
+        batch.total += count
+        if batch.total >= COALESCE_BATCH_MAX:
+            self._dispatch(key, batch)
+        return await future
+
+    def _dispatch(self, key, batch):
+        if self._batches.get(key) is not batch:
+            return  # already sent early
+        del self._batches[key]
+        asyncio.get_running_loop().create_task(self._run_batch(key, batch.waiters, batch.total))
+
+    async def _run_batch(self, key, waiters, total):
+        try:
+            if len(waiters) == 1:
+                lines = [[line for _, line in await self.run_job(key, total, None)]]
+            else:
+                lines = await self._split_batch(key, waiters, total)
+        except Exception as exc:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(waiters, lines):
+            if not future.done():
+                future.set_result(result)
+
+    async def _split_batch(self, key, waiters, total):
+        try:
+            pairs = await self.run_job(key, total, None)
+        except CapacityError:
+            # The merged request may not fit a small question space even when each one does.
+            results = await asyncio.gather(
+                *(self.run_job(key, count, None) for count, _ in waiters), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+            return [[line for _, line in pairs] for pairs in results]
+        per_count = BANKS[key[0]].questions_per_count(key[1])
+        out, offset = [], 0
+        for count, _ in waiters:
+            size = count * per_count
+            out.append([line for _, line in pairs[offset:offset + size]])
+            offset += size
+        return out
+
+    async def bulk_lines(self, key, count, seed):
+        """Yield JSON lines shard by shard with a bounded window of shards in flight.
+
+        Uses the same :class:`qbank.parallel.ShardMerge` as the CLI, so a seed gives the
+        same questions as ``python -m qbank``.
+        """
+        shards = ShardMerge(key[0], key[1], key[2], count, seed)
+        pending = deque()
+
+        def fill():
+            while len(pending) < 2 * self.workers:
+                shard = shards.next_shard()
+                if shard is None:
+                    return
+                shard_count, shard_seed = shard
+                pending.append(asyncio.ensure_future(self.run_job(key, shard_count, shard_seed, seed)))
+
+        try:
+            while not shards.done:
+                fill()
+                pairs = await pending.popleft()
+                fill()
+                yield [line for _, line in shards.merge(pairs, key=itemgetter(0))]
+        finally:
+            for future in pending:
+                future.cancel()
+
+    # ----- HTTP -----
+    async def handle_connection(self, reader, writer):
+        if self.connections >= MAX_CONNECTIONS:
+            await self._respond(writer, 503, {"error": "too many connections"}, keep_alive=False,
+                                extra={"Retry-After": str(RETRY_AFTER_SECONDS)})
+            writer.close()
+            return
+        self.connections += 1
+        try:
+            while True:
+                try:
+                    head = await read_head(reader)
+                except HTTPError as exc:
+                    # The rest of an oversized line is still unread, so the connection cannot be reused.
+                    await self._respond(writer, exc.status, {"error": str(exc)}, keep_alive=False)
+                    break
+                if head is None:
+                    break
+                parts, headers = head
+                if len(parts) != 3:
+                    await self._respond(writer, 400, {"error": "malformed request line"}, keep_alive=False)
+                    break
+                method, target, version = parts
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                try:
+                    length = int(headers.get("content-length", 0))
+                except ValueError:
+                    length = -1
+                if not 0 <= length <= MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": f"body must be at most {MAX_BODY_BYTES} bytes"},
+                                        keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = await self.dispatch(method, target, body, writer, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def dispatch(self, method, target, body, writer, keep_alive):
+        """Answer one request; returns whether the connection may be reused."""
+        url = urlsplit(target)
+        route = url.path.rstrip("/") or "/"
+        start = time.perf_counter()
+        status = 200
+        try:
+            if route == "/health":
+                await self._respond(writer, 200, {
+                    "status": "ok", "workers": self.workers, "pending_jobs": self.pending_jobs,
+                    "connections": self.connections, "bulk_streams": self.bulk_streams,
+                }, keep_alive)
+            elif route == "/metrics":
+                if not metrics.enabled:
+                    raise HTTPError(404, f"metrics are disabled; set {metrics.METRICS_ENV}=1 to enable them")
+                text = metrics.render_prometheus().encode("utf-8")
+                await self._respond_bytes(writer, 200, text, "text/plain; version=0.0.4; charset=utf-8", keep_alive)
+            elif route in ("/generate", "/bulk-generate"):
+                if method not in ("GET", "POST"):
+                    raise HTTPError(405, f"{method} is not allowed on {route}")
+                key, count, seed = parse_params(read_params(method, url.query, body))
+                if route == "/generate":
+                    await self._generate(writer, key, count, seed, keep_alive)
+                else:
+                    keep_alive = await self._bulk_generate(writer, key, count, seed, keep_alive)
+            else:
+                raise HTTPError(404, f"no route {route!r}")
+        except HTTPError as exc:
+            status = exc.status
+            extra = {"Retry-After": str(RETRY_AFTER_SECONDS)} if status == 503 else None
+            await self._respond(writer, status, {"error": str(exc)}, keep_alive, extra)
+        except CapacityError as exc:
+            status = 409
+            await self._respond(writer, status, {"error": str(exc)}, keep_alive)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            raise
+        except Exception as exc:
+            status = 500
+            await self._respond(writer, status, {"error": f"{type(exc).__name__}: {exc}"}, keep_alive=False)
+            keep_alive = False
+        if metrics.enabled:
+            metrics.inc("qbank_http_requests_total", route=route, status=status)
+            metrics.observe("qbank_http_request_seconds", time.perf_counter() - start, route=route)
+        return keep_alive
+
+    async def _generate(self, writer, key, count, seed, keep_alive):
+        if count > MAX_GENERATE_COUNT:
+            raise HTTPError(400, f"count above {MAX_GENERATE_COUNT}; use /bulk-generate")
+        if self.overloaded():
+            raise HTTPError(503, "generation backlog is full; retry shortly")
+        lines = await self.generate(key, count, seed)
+        body = ('{"questions": [' + ", ".join(lines) + "]}").encode("utf-8")
+        await self._respond_bytes(writer, 200, body, "application/json", keep_alive)
+
+    async def _bulk_generate(self, writer, key, count, seed, keep_alive):
+        if count > MAX_BULK_COUNT:
+            raise HTTPError(400, f"count above {MAX_BULK_COUNT}")
+        if self.bulk_streams >= MAX_BULK_STREAMS or self.overloaded():
+            raise HTTPError(503, "too many bulk streams in progress; retry shortly")
+        if seed is None:
+            seed = new_seed()
+        self.bulk_streams += 1
+        try:
+            writer.write(self._head(200, "application/x-ndjson", keep_alive, {"Transfer-Encoding": "chunked"}))
+            # The headers are out: from here on a failure can only end the stream, never start a new response.
+            try:
+                async for lines in self.bulk_lines(key, count, seed):
+                    if lines:
+                        self._write_chunk(writer, "\n".join(lines) + "\n")
+                        # Waiting for the client to drain keeps at most one window of shards buffered.
+                        await writer.drain()
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception as exc:
+                message = str(exc) if isinstance(exc, CapacityError) else f"{type(exc).__name__}: {exc}"
+                self._write_chunk(writer, json.dumps({"error": message}) + "\n")
+                keep_alive = isinstance(exc, CapacityError) and keep_alive
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        finally:
+            self.bulk_streams -= 1
+        return keep_alive
+
+    @staticmethod
+    def _write_chunk(writer, text):
+        chunk = text.encode("utf-8")
+        writer.write(b"%x\r\n%b\r\n" % (len(chunk), chunk))
+
+    @staticmethod
+    def _head(status, content_type, keep_alive, extra=None, length=None):
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}", f"Content-Type: {content_type}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        if length is not None:
+            lines.append(f"Content-Length: {length}")
+        lines.extend(f"{name}: {value}" for name, value in (extra or {}).items())
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _respond_bytes(self, writer, status, body, content_type, keep_alive, extra=None):
+        writer.write(self._head(status, content_type, keep_alive, extra, len(body)) + body)
+        await writer.drain()
+
+    async def _respond(self, writer, status, payload, keep_alive, extra=None):
+        await self._respond_bytes(writer, status, json.dumps(payload).encode("utf-8"), "application/json",
+                                  keep_alive, extra)
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None):
+    service = QuestionService(workers)
+    server = await asyncio.start_server(
+        service.handle_connection, host, port, backlog=MAX_CONNECTIONS, limit=MAX_LINE_BYTES
+    )
+    loop = asyncio.get_running_loop()
+    stop = loop.create_future()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, lambda: stop.done() or stop.set_result(None))
+        except (NotImplementedError, RuntimeError):  # Windows event loops
+            pass
+    print(f"qbank service listening on http://{host}:{port} with {service.workers} workers", flush=True)
+    try:
+        async with server:
+            await stop
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m qbank.service", description="Serve question generation over HTTP.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"address to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"port to bind (default: {DEFAULT_PORT})")
+    parser.add_argument("--workers", type=int, default=None, help="generator worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    metrics.start_from_env()
+    asyncio.run(serve(args.host, args.port, args.workers))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,263 @@
+"""Template-filling generators shared by the stack and queue banks.
+
+Template strings are compiled once into :class:`CompiledTemplate` objects that
+know their slots and value pools, so filling a template costs one draw per
+slot group plus a single ``str.format`` call.
+
+Every template also has an exact combination-space size.  Long-answer questions
+are drawn without replacement by walking a lazy random permutation of that
+space (:class:`IndexPermutation`) and decoding each index, so every draw yields
+a new question and over-large requests fail fast with :class:`CapacityError`.
+"""
+import random
+import re
+import string
+from bisect import bisect_right
+from itertools import islice
+from math import perm
+from time import perf_counter
+
+from . import metrics
+from .dedup import CLAIM_BATCH, claim_unseen
+from .errors import CapacityError
+
+# Numbered MCQ slots draw distinct values from a shared pool, e.g. {option1}..{option4}.
+NUMBERED_SLOT = re.compile(r'^([a-z_]+?)(\d+)$')
+SLOT_POOL_ALIASES = {
+    "option": "operation",
+    "use_case": "application",
+}
+_formatter = string.Formatter()
+
+
+# ----- COMPILED TEMPLATES -----
+class CompiledTemplate:
+    __slots__ = ("source", "slots", "groups", "size", "_format")
+
+    def __init__(self, source, slots, groups, format_string):
+        self.source = source
+        # Unique slot names in order of first appearance.
+        self.slots = slots
+        # (pool, slot indexes) pairs; slots in one group always get distinct values.
+        self.groups = groups
+        # Number of distinct fillings: a k-slot group over n values has n!/(n-k)! arrangements.
+        self.size = 1
+        for pool, indexes in groups:
+            self.size *= perm(len(pool), len(indexes))
+        self._format = format_string.format
+
+    def __repr__(self):
+        return f"CompiledTemplate({self.source!r})"
+
+    def fill(self, rng=random):
+        values = [None] * len(self.slots)
+        for pool, indexes in self.groups:
+            if len(indexes) == 1:
+                values[indexes[0]] = rng.choice(pool)
+            else:
+                for index, value in zip(indexes, rng.sample(pool, len(indexes))):
+                    values[index] = value
+        return self._format(*values)
+
+    def fill_index(self, index):
+        # Mixed-radix decode of index in [0, size): one digit per slot, where the
+        # radix shrinks by one for each value already taken from the same group.
+        values = [None] * len(self.slots)
+        for pool, indexes in self.groups:
+            if len(indexes) == 1:
+                index, digit = divmod(index, len(pool))
+                values[indexes[0]] = pool[digit]
+                continue
+            remaining = list(pool)
+            for slot in indexes:
+                index, digit = divmod(index, len(remaining))
+                values[slot] = remaining.pop(digit)
+        return self._format(*values)
+
+
+class TemplateSpace:
+    """The concatenated combination spaces of one (subtopic, level) template list."""
+
+    __slots__ = ("templates", "offsets", "size")
+
+    def __init__(self, templates):
+        self.templates = templates
+        self.offsets = []
+        self.size = 0
+        for t in templates:
+            self.offsets.append(self.size)
+            self.size += t.size
+
+    def question(self, index):
+        i = bisect_right(self.offsets, index) - 1
+        return self.templates[i].fill_index(index - self.offsets[i])
+
+
+class IndexPermutation:
+    """Lazy pseudo-random permutation of range(size).
+
+    Small spaces are simply shuffled.  Larger ones go through a Feistel network
+    over a power-of-four domain: iterating walks that domain from a random
+    offset and keeps the outputs that fall inside ``range(size)``, so each index
+    appears exactly once and memory stays constant however large the space is.
+    """
+
+    ROUNDS = 6
+    SHUFFLE_LIMIT = 1 << 16
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, size, rng=random):
+        self.size = size
+        self.rng = rng
+        self.half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+        self.half_mask = (1 << self.half_bits) - 1
+        if size > self.SHUFFLE_LIMIT:
+            self.keys = [rng.getrandbits(64) for _ in range(self.ROUNDS)]
+            self.start = rng.getrandbits(2 * self.half_bits)
+
+    def _round(self, right, key):
+        v = ((right ^ key) * 0x9E3779B97F4A7C15) & self._MASK64
+        v ^= v >> 29
+        return v & self.half_mask
+
+    def permute(self, x):
+        left, right = x >> self.half_bits, x & self.half_mask
+        for key in self.keys:
+            left, right = right, left ^ self._round(right, key)
+        return (left << self.half_bits) | right
+
+    def __iter__(self):
+        size = self.size
+        if size <= self.SHUFFLE_LIMIT:
+            order = list(range(size))
+            self.rng.shuffle(order)
+            yield from order
+            return
+        domain = 1 << (2 * self.half_bits)
+        for i in range(domain):
+            y = self.permute((self.start + i) & (domain - 1))
+            if y < size:
+                yield y
+
+
+def resolve_slot(name, placeholders):
+    """Return the (group, pool key) a slot name draws from."""
+    if name in placeholders:
+        return name, name
+    if name.startswith("alternative_") and name[len("alternative_"):] in placeholders:
+        # {alternative_operation} must differ from {operation} in the same template.
+        base = name[len("alternative_"):]
+        return base, base
+    match = NUMBERED_SLOT.match(name)
+    if match:
+        base = match.group(1)
+        pool_key = SLOT_POOL_ALIASES.get(base, base)
+        if pool_key in placeholders:
+            return base, pool_key
+    raise ValueError(f"template slot {{{name}}} has no placeholder pool")
+
+
+def compile_template(source, placeholders, constants=None):
+    slots, groups, pieces = [], {}, []
+    for literal, name, _, _ in _formatter.parse(source):
+        pieces.append(literal.replace("{", "{{").replace("}", "}}"))
+        if name is None:
+            continue
+        if constants and name in constants:
+            pieces.append(str(constants[name]).replace("{", "{{").replace("}", "}}"))
+            continue
+        if name not in slots:
+            group, pool_key = resolve_slot(name, placeholders)
+            groups.setdefault(group, (tuple(placeholders[pool_key]), []))[1].append(len(slots))
+            slots.append(name)
+        pieces.append(f"{{{slots.index(name)}}}")
+    return CompiledTemplate(
+        source,
+        tuple(slots),
+        tuple((pool, tuple(indexes)) for pool, indexes in groups.values()),
+        "".join(pieces),
+    )
+
+
+def compile_templates(sources, placeholders, constants=None):
+    # dict.fromkeys drops repeated sources so distinct indexes never render the same text.
+    unique = dict.fromkeys(t for t in sources if isinstance(t, str))
+    return [compile_template(t, placeholders, constants) for t in unique]
+
+
+def compile_template_bank(template_bank, placeholders, constants_by_level=None):
+    # Non-string entries (the Code Tracing snippets) have their own generator and are skipped.
+    compiled = {}
+    for subtopic, by_level in template_bank.items():
+        for level, sources in by_level.items():
+            constants = constants_by_level.get(level) if constants_by_level else None
+            templates = compile_templates(sources, placeholders, constants)
+            if templates:
+                compiled.setdefault(subtopic, {})[level] = TemplateSpace(templates)
+    return compiled
+
+
+# ----- FUNCTION TO GENERATE TEMPLATE QUESTIONS -----
+def _check_unused_capacity(space, subtopic, level, count, used_questions):
+    """Raise CapacityError before anything is claimed if fewer than ``count`` questions are unused."""
+    # Every used question could be in this space; only enumerate when that could leave too few.
+    if len(used_questions) + count <= space.size:
+        return
+    unused = 0
+    for index in range(space.size):
+        if space.question(index) not in used_questions:
+            unused += 1
+            if unused >= count:
+                return
+    raise CapacityError(f"{subtopic} / {level} has only {unused} unused long-answer questions; {count} requested")
+
+def iter_template_questions(compiled_bank, subtopic, level, count, used_questions=None, rng=random):
+    space = compiled_bank.get(subtopic, {}).get(level)
+    if space is None or count <= 0:
+        return
+    if count > space.size:
+        raise CapacityError(
+            f"{subtopic} / {level} has only {space.size} distinct long-answer questions; {count} requested"
+        )
+    if used_questions is not None:
+        _check_unused_capacity(space, subtopic, level, count, used_questions)
+    produced = 0
+    indexes = iter(IndexPermutation(space.size, rng))
+    fill = metrics.timed(space.question, "qbank_template_fill_seconds", kind="Long Answer")
+    while produced < count:
+        # Never render more than is still needed, so claimed questions are always yielded.
+        questions = [fill(i) for i in islice(indexes, min(count - produced, CLAIM_BATCH))]
+        if not questions:
+            raise CapacityError(
+                f"{subtopic} / {level} ran out of unused long-answer questions after {produced} of {count}"
+            )
+        if used_questions is not None:
+            questions = [q for q, is_new in zip(questions, claim_unseen(used_questions, questions)) if is_new]
+        for question in questions:
+            yield {"type": "template", "subtopic": subtopic, "level": level, "question": question}
+        produced += len(questions)
+
+
+def generate_template_questions(compiled_bank, subtopic, level, count, used_questions=None, rng=random):
+    return list(iter_template_questions(compiled_bank, subtopic, level, count, used_questions, rng))
+
+def template_space_size(compiled_bank, subtopic, level):
+    space = compiled_bank.get(subtopic, {}).get(level)
+    return 0 if space is None else space.size
+
+
+# ----- FUNCTION TO GENERATE MCQ / TRUE-FALSE / ONE WORD / FILL IN THE BLANKS QUESTIONS -----
+def iter_typed_questions(compiled_new_bank, question_type, subtopic, count, rng=random):
+    templates = compiled_new_bank[question_type]
+    timed = metrics.enabled
+    for _ in range(count):
+        if timed:
+            start = perf_counter()
+        question = rng.choice(templates).fill(rng)
+        if timed:
+            metrics.observe("qbank_template_fill_seconds", perf_counter() - start, kind=question_type)
+        yield {"type": question_type, "subtopic": subtopic, "question": question}
+
+
+def generate_typed_questions(compiled_new_bank, question_type, subtopic, count, rng=random):
+    return list(iter_typed_questions(compiled_new_bank, question_type, subtopic, count, rng))
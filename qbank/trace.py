@@ -0,0 +1,128 @@
+"""Delta-encoded step traces for stack, queue and ring-buffer state.
+
+A :class:`DeltaTrace` stores what each step changed (push, pop, set, ...) rather than a
+copy of the whole state per step. Full keyframes are added only once the deltas since
+the previous keyframe outnumber the state's size, so the keyframes never take more
+room than the deltas and a trace of n steps needs O(n) storage. The state at any step
+is rebuilt from the nearest keyframe, or the whole trace is replayed in order.
+"""
+import bisect
+
+PUSH, POP, PUSHLEFT, POPLEFT, SET = "push", "pop", "pushleft", "popleft", "set"
+KEYFRAME_MIN_DELTAS = 32
+# States longer than this are shown as head ... tail so each rendered line stays bounded.
+STATE_DISPLAY_LIMIT = 64
+STATE_DISPLAY_EDGE = 16
+
+
+class DeltaTrace:
+    """Per-step deltas of one sequence, with an optional note per step.
+
+    The traced code keeps its own state and reports every change here. Removed and
+    overwritten values are recorded too, so each step can also be read backwards.
+    """
+
+    __slots__ = ("initial", "deltas", "ends", "notes", "keyframes", "_since_keyframe")
+
+    def __init__(self, initial=()):
+        self.initial = tuple(initial)
+        self.deltas = []
+        self.ends = []
+        self.notes = []
+        self.keyframes = []
+        self._since_keyframe = 0
+
+    def __len__(self):
+        return len(self.ends)
+
+    def push(self, value):
+        self.deltas.append((PUSH, value))
+
+    def pop(self, value):
+        self.deltas.append((POP, value))
+
+    def pushleft(self, value):
+        self.deltas.append((PUSHLEFT, value))
+
+    def popleft(self, value):
+        self.deltas.append((POPLEFT, value))
+
+    def set(self, index, value, old=None):
+        self.deltas.append((SET, index, value, old))
+
+    def step(self, note=None, current=None):
+        """Close the current step; ``current`` is the live state, used when a keyframe is due."""
+        start = self.ends[-1] if self.ends else 0
+        self.ends.append(len(self.deltas))
+        self.notes.append(note)
+        self._since_keyframe += len(self.deltas) - start
+        if current is not None and self._since_keyframe >= max(len(current), KEYFRAME_MIN_DELTAS):
+            self.keyframes.append((len(self.ends) - 1, tuple(current)))
+            self._since_keyframe = 0
+
+    def replay(self, start=0):
+        """Yield ``(note, step deltas, state)`` from step ``start`` on.
+
+        ``state`` is one list updated in place between steps; copy it to keep it.
+        """
+        if start >= len(self.ends):
+            return
+        state = self.state_at(start - 1) if start else list(self.initial)
+        deltas, ends, notes = self.deltas, self.ends, self.notes
+        begin = ends[start - 1] if start else 0
+        for step in range(start, len(ends)):
+            end = ends[step]
+            step_deltas = deltas[begin:end]
+            for delta in step_deltas:
+                _apply(state, delta)
+            yield notes[step], step_deltas, state
+            begin = end
+
+    def state_at(self, step):
+        """State after ``step`` (-1 for the initial state) as a new list."""
+        if step < 0:
+            return list(self.initial)
+        if step >= len(self.ends):
+            raise IndexError(f"step {step} out of range for a trace of {len(self.ends)} steps")
+        index = bisect.bisect_right(self.keyframes, step, key=lambda frame: frame[0]) - 1
+        if index >= 0:
+            frame_step, frame = self.keyframes[index]
+            state, begin = list(frame), self.ends[frame_step]
+        else:
+            state, begin = list(self.initial), 0
+        for delta in self.deltas[begin:self.ends[step]]:
+            _apply(state, delta)
+        return state
+
+
+def _apply(state, delta):
+    op = delta[0]
+    if op == PUSH:
+        state.append(delta[1])
+    elif op == POP:
+        state.pop()
+    elif op == SET:
+        state[delta[1]] = delta[2]
+    elif op == PUSHLEFT:
+        state.insert(0, delta[1])
+    elif op == POPLEFT:
+        del state[0]
+    else:
+        raise ValueError(f"Unknown trace delta {delta!r}")
+
+
+# ----- DISPLAY -----
+def display_list(items, limit=STATE_DISPLAY_LIMIT):
+    if len(items) <= limit:
+        return repr(list(items))
+    head = ', '.join(map(repr, items[:STATE_DISPLAY_EDGE]))
+    tail = ', '.join(map(repr, items[-STATE_DISPLAY_EDGE:]))
+    return f"[{head}, ... {len(items) - 2 * STATE_DISPLAY_EDGE} more ..., {tail}]"
+
+def display_digits(digits, limit=STATE_DISPLAY_LIMIT):
+    if len(digits) <= limit:
+        return ''.join(digits)
+    return (
+        f"{''.join(digits[:STATE_DISPLAY_EDGE])}...{''.join(digits[-STATE_DISPLAY_EDGE:])}"
+        f" ({len(digits)} digits)"
+    )
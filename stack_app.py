@@ -0,0 +1,144 @@
+import streamlit as st
+
+from app_ui import (
+    add_questions, clear_questions, export_controls, get_question_pools, init_question_state, question_page, start_metrics
+)
+from qbank import metrics
+from qbank.dedup import open_default_store
+from qbank.errors import CapacityError
+from qbank.explain import render_explanation
+# Bank data and compiled templates live in qbank and are built once per process at import;
+# Streamlit reruns re-execute only this script.
+from qbank.stacks import levels, question_types, subtopics
+
+# One persistent dedup index per process when QBANK_DEDUP_DB is set, shared by all sessions.
+@st.cache_resource
+def get_dedup_store():
+    return open_default_store()
+
+# ----- STREAMLIT APP UI -----
+# set_page_config must be the first Streamlit command of the script run.
+st.set_page_config(page_title="Stack Question Generator", layout="centered")
+start_metrics()
+
+st.markdown("""
+<style>
+body {
+    background-color: #ffffff;
+    color: #6b7280;
+    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+    line-height: 1.6;
+    margin: 0;
+    padding: 0 2rem;
+    max-width: 1200px;
+    margin-left: auto;
+    margin-right: auto;
+}
+h1, h2, h3, h4 {
+    font-weight: 700;
+    color: #111827;
+    line-height: 1.2;
+}
+h1 {
+    font-size: 3rem;
+    margin: 2rem 0 1rem 0;
+    font-weight: 800;
+}
+.explanation {
+    background-color: #f9fafb;
+    border-radius: 0.75rem;
+    padding: 1rem 1.25rem;
+    margin-top: 1rem;
+    color: #374151;
+    font-size: 1rem;
+    box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+    white-space: pre-wrap;
+}
+.stButton>button {
+    background-color: #111827 !important;
+    color: white !important;
+    font-weight: 600 !important;
+    border-radius: 0.5rem !important;
+    padding: 0.6rem 1.2rem !important;
+    transition: background-color 0.3s ease;
+}
+.stButton>button:hover {
+    background-color: #374151 !important;
+}
+.stSelectbox>div>div>div>select {
+    color: #374151;
+    font-weight: 500;
+}
+.stSlider>div>input[type="range"] {
+    accent-color: #111827;
+}
+.stCheckbox>div>label {
+    color: #374151;
+    font-weight: 500;
+}
+code {
+    font-family: 'Source Code Pro', monospace;
+    background-color: #f3f4f6;
+    padding: 0.25rem 0.5rem;
+    border-radius: 0.375rem;
+    color: #111827;
+}
+</style>
+""", unsafe_allow_html=True)
+
+st.title("🧠 Stack Question Generator")
+
+init_question_state()
+
+with st.form("question_form"):
+    selected_subtopic = st.selectbox("Select Subtopic", subtopics, key="subtopic")
+    selected_level = st.selectbox("Select Level", levels, key="level")
+    selected_type = st.selectbox("Select Question Type", question_types, key="type")
+    question_count = st.slider("Number of Questions", 1, 100, 10, key="count")
+    show_answers = st.checkbox("Show Answers", value=True, key="show_answers")
+    show_explanations = st.checkbox("Show Answer Explanations", value=True, key="show_explanations")
+    seed_text = st.text_input("Seed (optional, regenerates the same questions)", key="seed")
+    submit = st.form_submit_button("Generate Questions")
+
+seed = None
+if submit and seed_text.strip():
+    try:
+        seed = int(seed_text)
+    except ValueError:
+        st.error("Seed must be a whole number.")
+        submit = False
+
+if submit:
+    try:
+        new_questions = get_question_pools("stack").take(
+            "stack", selected_subtopic, selected_level, selected_type, question_count, get_dedup_store(), seed
+        )
+    except CapacityError as exc:
+        new_questions = []
+        st.error(f"{exc}. Lower the number of questions or pick another level.")
+    if not new_questions:
+        st.warning("No questions generated for the selected subtopic and level.")
+    else:
+        add_questions(new_questions)
+        st.success(f"{len(new_questions)} questions generated.")
+
+if st.session_state.all_questions:
+    st.markdown("### 📋 All Questions")
+    start, end = question_page(len(st.session_state.all_questions))
+    with metrics.timer("qbank_page_render_seconds", app="stack"):
+        for i, q in enumerate(st.session_state.all_questions[start:end], start + 1):
+            st.markdown(f"**Q{i} [{q.get('subtopic', '')} - {q.get('type', '')}]**:")
+            language = "python" if q.get("subtopic", "") == "Code Tracing" else None
+            st.code(q["question"], language=language)
+            if show_answers and "answer" in q:
+                st.markdown("**Answer:**")
+                st.code(q["answer"])
+                if show_explanations and "explanation" in q:
+                    st.markdown(f'<div class="explanation">{render_explanation(q["explanation"])}</div>', unsafe_allow_html=True)
+
+    export_controls(st.session_state.export)
+
+    if st.button("❌ Clear All"):
+        clear_questions()
+        st.experimental_rerun()
+
@@ -0,0 +1,48 @@
+import threading
+
+from qbank.dedup import DedupStore, claim_unseen
+
+
+def test_claim_many_marks_first_occurrence_only(tmp_path):
+    with DedupStore(str(tmp_path / "issued.sqlite")) as store:
+        assert store.claim_many(["a", "b", "a"]) == [True, True, False]
+        assert store.claim_many(["b", "c"]) == [False, True]
+        assert len(store) == 3
+        assert "c" in store and "d" not in store
+
+
+def test_claims_persist_across_connections(tmp_path):
+    path = str(tmp_path / "issued.sqlite")
+    with DedupStore(path) as store:
+        store.claim_many(["a", "b"])
+    with DedupStore(path) as store:
+        assert store.claim_many(["a", "b", "c"]) == [False, False, True]
+
+
+def test_concurrent_claims_grant_each_key_once(tmp_path):
+    path = str(tmp_path / "issued.sqlite")
+    keys = [f"question {i}" for i in range(300)]
+    claimed = []
+    lock = threading.Lock()
+
+    def claim(offset):
+        with DedupStore(path) as store:
+            for start in range(0, len(keys), 50):
+                batch = keys[start:start + 50]
+                batch = batch[offset:] + batch[:offset]
+                won = [key for key, is_new in zip(batch, store.claim_many(batch)) if is_new]
+                with lock:
+                    claimed.extend(won)
+
+    threads = [threading.Thread(target=claim, args=(offset,)) for offset in (0, 10, 25, 40)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(claimed) == sorted(keys)
+
+
+def test_claim_unseen_on_plain_set():
+    used = {"a"}
+    assert claim_unseen(used, ["a", "b", "b"]) == [False, True, False]
+    assert used == {"a", "b"}
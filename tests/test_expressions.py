@@ -0,0 +1,108 @@
+import random
+import re
+
+import pytest
+
+from qbank.errors import ExpressionLimitError
+from qbank.expressions import (
+    evaluate_postfix, infix_to_postfix, infix_to_prefix, operators, random_infix, tokenize, trace_conversion
+)
+
+
+def evaluate_prefix(expr):
+    tokens = iter(tokenize(expr, postfix=True))
+
+    def parse():
+        token = next(tokens)
+        if token[-1].isdigit():
+            return int(token)
+        a = parse()
+        b = parse()
+        return operators[token][1](a, b)
+
+    return parse()
+
+
+@pytest.mark.parametrize("expr, tokens", [
+    ("12*(3+4)", ("12", "*", "(", "3", "+", "4", ")")),
+    ("-3*(-4)", ("-3", "*", "(", "-4", ")")),
+    ("3-4", ("3", "-", "4")),
+    ("(1)-2", ("(", "1", ")", "-", "2")),
+])
+def test_tokenize_infix(expr, tokens):
+    assert tokenize(expr) == tokens
+
+
+def test_tokenize_postfix_keeps_glued_sign():
+    assert tokenize("3 -4 +", postfix=True) == ("3", "-4", "+")
+
+
+def test_tokenize_rejects_unknown_character():
+    with pytest.raises(ValueError):
+        tokenize("3 & 4")
+
+
+@pytest.mark.parametrize("infix, postfix, prefix", [
+    ("3 % 6 % 10", "3 6 % 10 %", "% % 3 6 10"),
+    ("8 - 3 - 2", "8 3 - 2 -", "- - 8 3 2"),
+    ("16 / 4 * 2", "16 4 / 2 *", "* / 16 4 2"),
+    ("1 + 2 * 3", "1 2 3 * +", "+ 1 * 2 3"),
+    ("(1 + 2) * 3", "1 2 + 3 *", "* + 1 2 3"),
+    ("2 ^ 3 ^ 2", "2 3 ^ 2 ^", "^ ^ 2 3 2"),
+])
+def test_conversion_is_left_associative(infix, postfix, prefix):
+    assert infix_to_postfix(infix) == postfix
+    assert infix_to_prefix(infix) == prefix
+
+
+def test_prefix_and_postfix_agree_on_random_expressions():
+    rng = random.Random(15)
+    for _ in range(500):
+        infix = random_infix(rng)
+        try:
+            value = evaluate_postfix(infix_to_postfix(infix))
+        except ExpressionLimitError:
+            continue
+        assert evaluate_prefix(infix_to_prefix(infix)) == value, infix
+
+
+def test_conversion_trace_replays_to_empty_stack():
+    output, trace = trace_conversion(tokenize("(1 + 2) * 3 - 4"))
+    assert output == ["1", "2", "+", "3", "*", "4", "-"]
+    assert trace.state_at(len(trace) - 1) == []
+
+
+@pytest.mark.parametrize("infix, message", [
+    ("3+4)", "Unbalanced parentheses"),
+    ("3+(4", "Unbalanced parentheses"),
+    ("(3+4))*(2", "Unbalanced parentheses"),
+    ("-(3+4)", "Unary minus before '('"),
+    ("2*-(1)", "Unary minus before '('"),
+    ("3 +", "operand"),
+    ("* 3", "operand"),
+    ("3 4", "Missing operator"),
+    ("(3)(4)", "Missing operator"),
+    ("()", "Missing operand"),
+    ("", "Missing operand"),
+])
+def test_malformed_infix_is_rejected(infix, message):
+    for convert in (infix_to_postfix, infix_to_prefix):
+        with pytest.raises(ValueError, match=re.escape(message)):
+            convert(infix)
+
+
+@pytest.mark.parametrize("postfix, message", [
+    ("3 4 ( +", "Unexpected token '('"),
+    ("3 +", "missing an operand"),
+    ("3 4 5 +", "leaves 2 values"),
+    ("", "is empty"),
+])
+def test_malformed_postfix_is_rejected(postfix, message):
+    with pytest.raises(ValueError, match=re.escape(message)):
+        evaluate_postfix(postfix)
+
+
+def test_signed_operands_still_parse():
+    assert infix_to_postfix("-3*(-4)") == "-3 -4 *"
+    assert infix_to_postfix("(1)-(2)") == "1 2 -"
+    assert evaluate_postfix("3 -4 +") == -1
@@ -0,0 +1,57 @@
+import random
+import re
+
+import pytest
+
+from qbank.graphs import GRAPH_KINDS, bfs, describe_graph, gnp_edges, graph_question, random_gnp, random_graph
+
+
+def brute_force_distances(adj, sources):
+    dist = [-1] * len(adj)
+    for s in sources:
+        dist[s] = 0
+    changed = True
+    while changed:
+        changed = False
+        for v, neighbours in enumerate(adj):
+            if dist[v] < 0:
+                continue
+            for w in neighbours:
+                if dist[w] < 0 or dist[v] + 1 < dist[w]:
+                    dist[w] = dist[v] + 1
+                    changed = True
+    return dist
+
+
+@pytest.mark.parametrize("kind", GRAPH_KINDS)
+def test_bfs_distances_and_paths(kind):
+    rng = random.Random(kind)
+    for _ in range(100):
+        graph = random_graph(kind, rng.randint(2, 40), rng)
+        sources = [graph.root] + rng.sample(graph.open_nodes(), 1)
+        result = bfs(graph.adj, sources)
+        assert result.dist == brute_force_distances(graph.adj, sources)
+        assert [result.dist[v] for v in result.order] == sorted(result.dist[v] for v in result.order)
+        for v in result.order:
+            path = result.path_to(v)
+            assert len(path) - 1 == result.dist[v] and path[0] in sources
+            assert all(b in graph.adj[a] for a, b in zip(path, path[1:]))
+
+
+def test_gnp_edges_are_distinct_and_ordered():
+    edges = list(gnp_edges(2000, 0.002, random.Random(5)))
+    assert len(set(edges)) == len(edges)
+    assert all(0 <= w < v < 2000 for w, v in edges)
+    # Expected number of edges is p * n * (n - 1) / 2, about 4000.
+    assert 3500 < len(edges) < 4500
+
+
+def test_large_graphs_list_nodes_in_numeric_order():
+    text = describe_graph(random_gnp(150, rng=random.Random(2)))
+    assert re.findall(r"'(\d+)': \[", text) == [str(v) for v in range(150)]
+
+
+def test_questions_are_reproducible():
+    for level in ("Level 1", "Level 2", "Level 3"):
+        first = graph_question(level, random.Random(9))
+        assert graph_question(level, random.Random(9))[:2] == first[:2]
@@ -0,0 +1,48 @@
+import random
+from collections import deque
+
+import pytest
+
+from qbank.interpreter import DEQUE_OPS, QUEUE_OPS, compile_script, parse_op, render_trace, run_program, run_script
+from qbank.stacks import random_deque_script
+
+
+@pytest.mark.parametrize("text, parsed", [
+    ("append(5)", ("append", 5)),
+    (" appendleft( -3 ) ", ("appendleft", -3)),
+    ("pop()", ("pop", None)),
+])
+def test_parse_op(text, parsed):
+    assert parse_op(text) == parsed
+
+
+@pytest.mark.parametrize("ops", [["append"], ["append(1"], ["rotate(1)"], ["append()"], ["pop(2)"]])
+def test_compile_script_rejects_bad_ops(ops):
+    with pytest.raises(ValueError):
+        compile_script(ops, DEQUE_OPS)
+
+
+def test_deque_trace_matches_direct_calls():
+    rng = random.Random(11)
+    for _ in range(200):
+        start = rng.sample(range(1, 10), 3)
+        ops = random_deque_script(len(start), 8, rng)
+        dq, expected = deque(start), []
+        for op in ops:
+            name, arg = parse_op(op)
+            method = getattr(dq, name)
+            method() if arg is None else method(arg)
+            expected.append(f"Operation: {op} -> Deque State: {dq}")
+        state = deque(start)
+        assert run_script(ops, DEQUE_OPS, state) == expected
+        assert state == dq
+
+
+def test_untraced_run_gives_same_state():
+    ops = ["ENQUEUE(4)", "ENQUEUE(9)", "DEQUEUE()", "ENQUEUE(2)"]
+    program = compile_script(ops, QUEUE_OPS)
+    traced, untraced = deque(), deque()
+    steps = run_program(program, traced)
+    assert run_program(program, untraced, trace=False) is None
+    assert traced == untraced == deque([9, 2])
+    assert render_trace(steps)[-1] == "Operation: ENQUEUE(2) -> Queue State: [9, 2]"
@@ -0,0 +1,54 @@
+import random
+import time
+
+import pytest
+
+from qbank.errors import ExpressionLimitError
+from qbank.expressions import MAX_RESULT_BITS, checked_apply, evaluate_postfix, expression_questions, iter_expression_questions
+
+
+@pytest.mark.parametrize("token, a, b", [
+    ("^", 2, MAX_RESULT_BITS),
+    ("^", 10, 10 ** 6),
+    ("^", 3, -1),
+    ("*", 1 << 3000, 1 << 2000),
+    ("/", 5, 0),
+    ("%", 5, 0),
+    ("+", 1 << MAX_RESULT_BITS, 1),
+])
+def test_rejected_before_computing(token, a, b):
+    with pytest.raises(ExpressionLimitError):
+        checked_apply(token, a, b)
+
+
+@pytest.mark.parametrize("token, a, b", [
+    ("^", 2, MAX_RESULT_BITS - 1),
+    ("^", 1, 10 ** 9),
+    ("^", -1, 10 ** 9 + 1),
+    ("^", 0, 10 ** 9),
+    ("*", 1 << 2000, 1 << 2000),
+    ("-", -(1 << 4000), 1 << 4000),
+])
+def test_results_within_the_limit_are_exact(token, a, b):
+    result = checked_apply(token, a, b)
+    assert result.bit_length() <= MAX_RESULT_BITS + 1
+    assert result == {"^": pow, "*": int.__mul__, "-": int.__sub__}[token](a, b)
+
+
+def test_tower_of_powers_is_cheap():
+    start = time.perf_counter()
+    with pytest.raises(ExpressionLimitError):
+        evaluate_postfix("9 9 ^ 9 ^ 9 ^ 9 ^ 9 ^")
+    assert time.perf_counter() - start < 0.1
+
+
+def test_rejection_is_cached_as_a_limit_error():
+    for _ in range(2):
+        with pytest.raises(ExpressionLimitError):
+            expression_questions("7 / (3 - 3)")
+
+
+def test_generated_answers_stay_bounded():
+    for q in iter_expression_questions(2000, random.Random(18)):
+        if isinstance(q["answer"], int):
+            assert q["answer"].bit_length() <= MAX_RESULT_BITS
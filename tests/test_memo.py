@@ -0,0 +1,72 @@
+import threading
+from collections import OrderedDict
+
+import pytest
+
+from qbank.expressions import expression_questions
+from qbank.memo import CacheStats, LRUCache
+
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats() == CacheStats(hits=3, misses=1, evictions=1, currsize=2, maxsize=2)
+
+
+def test_matches_a_reference_lru():
+    cache, reference = LRUCache(8), OrderedDict()
+    for i in range(2000):
+        key = (i * 7919) % 23
+        if i % 3:
+            expected = reference.get(key)
+            if key in reference:
+                reference.move_to_end(key)
+            assert cache.get(key) == expected
+        else:
+            reference[key] = i
+            reference.move_to_end(key)
+            if len(reference) > 8:
+                reference.popitem(last=False)
+            cache.put(key, i)
+        assert len(cache) == len(reference)
+
+
+def test_zero_size_caches_nothing():
+    cache = LRUCache(0)
+    calls = []
+    assert cache.get_or_compute("k", lambda: calls.append(1) or 5) == 5
+    assert cache.get_or_compute("k", lambda: calls.append(1) or 5) == 5
+    assert len(calls) == 2 and len(cache) == 0
+    with pytest.raises(ValueError):
+        LRUCache(-1)
+
+
+def test_shared_across_threads():
+    cache = LRUCache(64)
+
+    def work(offset):
+        for i in range(5000):
+            key = (i + offset) % 100
+            assert cache.get_or_compute(key, lambda: key * 2) == key * 2
+
+    threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats.hits + stats.misses == 20000 and stats.currsize == 64
+
+
+def test_expression_hits_return_fresh_dicts():
+    cache = LRUCache(4)
+    first = expression_questions("1 + 2 * 3", cache=cache)
+    first[0]["seed"] = 1
+    second = expression_questions("1 + 2 * 3", cache=cache)
+    assert "seed" not in second[0] and second[0]["answer"] == 7
+    assert cache.stats().hits == 1
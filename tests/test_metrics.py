@@ -0,0 +1,40 @@
+import json
+import subprocess
+import sys
+import urllib.request
+
+import pytest
+
+from qbank import metrics
+
+
+@pytest.fixture
+def recording():
+    metrics.reset()
+    metrics.enable()
+    yield
+    metrics.disable()
+    metrics.reset()
+
+
+def test_import_does_not_load_http_server():
+    code = "import sys, qbank.metrics; print('http.server' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout == "False\n"
+
+
+def test_endpoint_serves_prometheus_text_and_json(recording):
+    metrics.inc("qbank_test_total", 2, kind="a")
+    metrics.observe("qbank_test_seconds", 0.001)
+    server = metrics.serve(0)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base}/metrics") as response:
+            text = response.read().decode("utf-8")
+        with urllib.request.urlopen(f"{base}/metrics.json") as response:
+            snapshot = json.load(response)
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert 'qbank_test_total{kind="a"} 2' in text
+    assert "qbank_test_seconds_count 1" in text
+    assert {"name": "qbank_test_total", "labels": {"kind": "a"}, "value": 2} in snapshot["counters"]
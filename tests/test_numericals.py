@@ -0,0 +1,68 @@
+import ast
+import random
+import re
+from collections import deque
+
+import pytest
+
+from qbank.interpreter import CIRCULAR_QUEUE_OPS, RING_DEQUE_OPS, CircularQueue, RingDeque, run_program
+from qbank.numericals import circular_queue_question, deque_question, random_program
+
+
+def ops_of(question):
+    return question.splitlines()[1].split(", ")
+
+
+def reference_deque(capacity, ops):
+    dq = deque()
+    for op in ops:
+        name, arg = re.fullmatch(r"(\w+)\((\d*)\)", op).groups()
+        if arg:
+            if len(dq) < capacity:
+                getattr(dq, name)(int(arg))
+        elif dq:
+            getattr(dq, name)()
+    return list(dq)
+
+
+@pytest.mark.parametrize("level", ["Level 1", "Level 2", "Level 3"])
+def test_ring_deque_matches_a_bounded_deque(level):
+    rng = random.Random(level)
+    for _ in range(300):
+        question, answer, _ = deque_question(level, rng)
+        capacity = int(re.search(r"array of size (\d+)", question).group(1))
+        assert answer.startswith(f"Deque State: {reference_deque(capacity, ops_of(question))},")
+
+
+@pytest.mark.parametrize("level", ["Level 1", "Level 2", "Level 3"])
+def test_circular_queue_matches_a_bounded_fifo(level):
+    rng = random.Random(level)
+    for _ in range(300):
+        question, answer, explanation = circular_queue_question(level, rng)
+        capacity = int(re.search(r"of size (\d+)", question).group(1))
+        ops = [op.replace("ENQUEUE", "append").replace("DEQUEUE", "popleft") for op in ops_of(question)]
+        items = reference_deque(capacity, ops)
+        slots = ast.literal_eval(answer.split("Queue State: ")[1])
+        front = int(re.search(r"Front Index: (\d+)", answer).group(1))
+        assert [slots[(front + i) % capacity] for i in range(len(items))] == items
+        assert len(explanation.render()) == len(ops)
+
+
+def test_level_one_has_no_faults():
+    rng = random.Random(3)
+    for _ in range(200):
+        _, _, explanation = deque_question("Level 1", rng)
+        assert not any("flow:" in line for line in explanation.render())
+
+
+def test_untraced_run_matches_traced():
+    rng = random.Random(8)
+    for table, state_type, push, pop in [
+        (CIRCULAR_QUEUE_OPS, CircularQueue, ("ENQUEUE",), ("DEQUEUE",)),
+        (RING_DEQUE_OPS, RingDeque, ("append", "appendleft"), ("pop", "popleft")),
+    ]:
+        program = random_program(table, push, pop, 5, 200, 0.2, rng)
+        traced, untraced = state_type(5), state_type(5)
+        steps = run_program(program, traced)
+        run_program(program, untraced, trace=False)
+        assert traced.slots == untraced.slots == steps.state_at(len(steps) - 1)
@@ -0,0 +1,59 @@
+import json
+
+from qbank import cli, stacks
+from qbank.dedup import DedupStore
+from qbank.export import dumps_question
+from qbank.parallel import iter_parallel_lines, iter_parallel_questions
+
+
+def lines(workers, **kwargs):
+    return list(iter_parallel_lines("stack", "Code Tracing", "Level 2", "Long Answer", 200, seed=7,
+                                    workers=workers, shard_size=30, **kwargs))
+
+
+def test_output_does_not_depend_on_worker_count():
+    assert lines(1) == lines(3)
+
+
+def test_lines_match_questions():
+    questions = iter_parallel_questions("stack", "Code Tracing", "Level 2", "Long Answer", 200, seed=7,
+                                        workers=1, shard_size=30)
+    assert lines(1) == [dumps_question(q) for q in questions]
+
+
+def test_questions_only_is_applied_in_the_workers():
+    for line in lines(2, questions_only=True):
+        assert "answer" not in json.loads(line)
+
+
+def test_unique_across_shards():
+    texts = [json.loads(line)["question"] for line in lines(2)]
+    assert len(texts) == len(set(texts)) == 200
+
+
+def run_cli(capsys, *argv):
+    status = cli.main(list(argv))
+    return status, capsys.readouterr().out.splitlines()
+
+
+def test_dedup_db_walks_a_nearly_issued_space(tmp_path, capsys):
+    path = str(tmp_path / "issued.sqlite")
+    space = [q["question"] for q in stacks.generate_questions("Operations", "Level 2", "Long Answer", 120, seed=1)]
+    with DedupStore(path) as store:
+        store.claim_many(space[:110])
+    status, out = run_cli(capsys, "--subtopic", "Operations", "--level", "Level 2", "--count", "10",
+                          "--dedup-db", path, "--seed", "3", "--workers", "2")
+    assert status == 0
+    assert sorted(json.loads(line)["question"] for line in out) == sorted(space[110:])
+
+
+def test_dedup_db_claims_nothing_when_the_run_cannot_finish(tmp_path, capsys):
+    path = str(tmp_path / "issued.sqlite")
+    space = [q["question"] for q in stacks.generate_questions("Operations", "Level 2", "Long Answer", 120, seed=1)]
+    with DedupStore(path) as store:
+        store.claim_many(space[:110])
+    status, out = run_cli(capsys, "--subtopic", "Operations", "--level", "Level 2", "--count", "11",
+                          "--dedup-db", path)
+    assert status == 2 and out == []
+    with DedupStore(path) as store:
+        assert len(store) == 110
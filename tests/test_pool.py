@@ -0,0 +1,111 @@
+import time
+
+import pytest
+
+from qbank import pool as pool_module
+from qbank import stacks
+from qbank.errors import CapacityError
+from qbank.pool import QuestionPools
+
+
+@pytest.fixture
+def pools():
+    with QuestionPools(capacity=20, low_water=10, refill_batch=5) as pools:
+        yield pools
+
+
+def wait_idle(pools, timeout=30):
+    deadline = time.monotonic() + timeout
+    while not pools.idle():
+        assert time.monotonic() < deadline, "refill thread never went idle"
+        time.sleep(0.01)
+
+
+def texts(questions):
+    return [q["question"] for q in questions]
+
+
+def test_take_is_unique_within_a_call(pools):
+    # A cold pool serves part of the call; the rest is generated directly.
+    pools.take("stack", "Operations", "Level 2", "Long Answer", 5)
+    wait_idle(pools)
+    questions = pools.take("stack", "Operations", "Level 2", "Long Answer", 100)
+    assert len(questions) == 100
+    assert len(set(texts(questions))) == 100
+
+
+def test_take_respects_used_questions(pools):
+    used = set()
+    seen = []
+    for _ in range(5):
+        seen += texts(pools.take("stack", "Code Tracing", "Level 1", "Long Answer", 15, used))
+        wait_idle(pools)
+    assert len(seen) == len(set(seen)) == 75
+    assert used >= set(seen)
+
+
+def test_ignored_inputs_share_a_pool(pools):
+    pools.take("stack", "Code Tracing", "Level 2", "Long Answer", 1)
+    pools.take("stack", "Code Tracing", "Level 2", "MCQ", 1)
+    pools.take("stack", "Introduction", "Level 1", "True/False", 1)
+    pools.take("stack", "Introduction", "Level 3", "True/False", 1)
+    assert len(pools.sizes()) == 2
+
+
+def test_small_template_space_fills_and_stops():
+    size = stacks.distinct_questions("Implementation", "Level 2", "Long Answer")
+    with QuestionPools(capacity=2 * size, low_water=size, refill_batch=size // 3) as pools:
+        # The pool fills to the whole space and the refill thread then rests.
+        pools.take("stack", "Implementation", "Level 2", "Long Answer", 1)
+        wait_idle(pools)
+        assert pools.sizes()[("stack", "Implementation", "Level 2", "Long Answer")] == size
+        questions = pools.take("stack", "Implementation", "Level 2", "Long Answer", size)
+        assert len(set(texts(questions))) == size
+        with pytest.raises(CapacityError):
+            pools.take("stack", "Implementation", "Level 2", "Long Answer", size + 1)
+
+
+def test_seeded_take_matches_generate_questions(pools):
+    expected = stacks.generate_questions("Operations", "Level 1", "Long Answer", 10, seed=7)
+    assert pools.take("stack", "Operations", "Level 1", "Long Answer", 10, seed=7) == expected
+
+
+def test_transient_refill_errors_are_retried(monkeypatch):
+    monkeypatch.setattr(pool_module, "REFILL_RETRY_DELAY", 0.01)
+    real = stacks.iter_questions
+    calls = []
+
+    def flaky(*args, **kwargs):
+        calls.append(args)
+        if len(calls) <= 2:
+            raise OSError("verifier workers went away")
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(stacks, "iter_questions", flaky)
+    with QuestionPools(capacity=20, low_water=10, refill_batch=5) as pools:
+        # A zero-count take only schedules the refill, so every call comes from the refill thread.
+        pools.take("stack", "Operations", "Level 1", "Long Answer", 0)
+        wait_idle(pools)
+        assert len(calls) > 2
+        assert pools.sizes()[("stack", "Operations", "Level 1", "Long Answer")] == 20
+
+
+def test_rejected_inputs_fail_the_pool_for_good(monkeypatch):
+    calls = []
+
+    def broken(*args, **kwargs):
+        calls.append(args)
+        raise ValueError("unsupported input")
+
+    monkeypatch.setattr(stacks, "iter_questions", broken)
+    monkeypatch.setattr(stacks, "generate_questions", broken)
+    with QuestionPools(capacity=20, low_water=10, refill_batch=5) as pools:
+        with pytest.raises(ValueError, match="unsupported"):
+            pools.take("stack", "Operations", "Level 1", "Long Answer", 1)
+        wait_idle(pools)
+        refills = len(calls)
+        with pytest.raises(ValueError, match="unsupported"):
+            pools.take("stack", "Operations", "Level 1", "Long Answer", 1)
+        wait_idle(pools)
+        # The second take generated directly; the failed pool was not refilled again.
+        assert len(calls) == refills + 1
@@ -0,0 +1,64 @@
+import pytest
+
+from qbank.sandbox import SnippetRunner
+from qbank.stacks import iter_code_tracing_candidates
+
+
+@pytest.fixture(scope="module")
+def runner():
+    with SnippetRunner(workers=2, timeout=0.3, memory_limit=256 * 1024 * 1024, cache=None, kill_grace=1.0) as runner:
+        yield runner
+
+
+def test_captures_output_and_errors(runner):
+    ok, failed = runner.run(["print(1)\nprint('a', end=' ')", "print(0)\n1 / 0"])
+    assert ok.ok and ok.stdout == "1\na " and ok.error is None
+    assert not failed.ok and failed.stdout == "0\n" and failed.error.startswith("ZeroDivisionError")
+
+
+def test_time_limit_stops_python_loops(runner):
+    [result] = runner.run(["while True:\n    pass"])
+    assert not result.ok and result.error.startswith("SnippetTimeout")
+
+
+def test_parent_kills_snippets_stuck_in_c_code(runner):
+    # sum() over a range never returns to the eval loop, so SIGALRM cannot fire.
+    hung, after = runner.run(["print(sum(range(10 ** 14)))", "print(2)"])
+    assert not hung.ok and hung.error.startswith("SnippetTimeout")
+    assert after.ok and after.stdout == "2\n"
+
+
+def test_memory_and_output_limits(runner):
+    memory, output = runner.run(["x = bytearray(1 << 30)", "while True:\n    print('x' * 1000)"])
+    assert not memory.ok and memory.error.startswith("MemoryError")
+    assert not output.ok and "more than" in output.error
+
+
+def test_imports_outside_the_allowlist_are_blocked(runner):
+    blocked, relative, allowed = runner.run([
+        "import os",
+        "from . import sandbox",
+        "from collections import deque\nprint(deque([1, 2]))",
+    ])
+    assert blocked.error == "ImportError: snippets may not import 'os'"
+    assert relative.error.startswith("ImportError")
+    assert allowed.ok and allowed.stdout == "deque([1, 2])\n"
+
+
+def test_crashed_worker_fails_only_its_snippet(runner):
+    crash = "import collections\ncollections._sys.modules['os']._exit(3)"
+    results = runner.run(["print(1)", crash, "print(3)"])
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[1].error.startswith("BrokenProcessPool")
+    assert runner.run(["print(4)"])[0].stdout == "4\n"
+
+
+def test_template_snippets_print_their_answers(runner):
+    pairs = []
+    for level in ("Level 1", "Level 2", "Level 3"):
+        candidates = iter_code_tracing_candidates("Code Tracing", level)
+        for _ in range(5):
+            question, printed = next(candidates)
+            pairs.append((question["question"], printed))
+    assert len(pairs) == 15 and all(runner.verify(pairs))
+    assert runner.verify([("print(1)", "2")]) == [False]
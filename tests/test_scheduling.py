@@ -0,0 +1,108 @@
+"""Every policy against a one-time-unit-at-a-time simulator of the same rules."""
+import random
+
+import pytest
+
+from qbank.scheduling import IDLE, MLFQ_QUANTA, Job, simulate
+
+
+def brute_force(algorithm, jobs, quantum=2):
+    """Per-job (start, finish) and the merged Gantt chart, one time unit per step."""
+    n = len(jobs)
+    remaining = [job.burst for job in jobs]
+    start, finish = [None] * n, [None] * n
+    levels = [0] * n
+    queues = [[] for _ in range(len(MLFQ_QUANTA) + 1)]
+    ready, timeline = [], []
+    current, used = None, 0
+    t = 0
+    while any(remaining):
+        arrived = [i for i in sorted(range(n), key=lambda i: (jobs[i].arrival, i)) if jobs[i].arrival == t]
+        if algorithm == "MLFQ":
+            queues[0].extend(arrived)
+        else:
+            ready.extend(arrived)
+        if current is not None:
+            # Decide whether the job that ran in the last unit keeps the CPU.
+            if not remaining[current]:
+                finish[current] = t
+                current = None
+            elif algorithm == "RR" and used == quantum:
+                ready.append(current)
+                current = None
+            elif algorithm == "MLFQ":
+                level = levels[current]
+                if level < len(MLFQ_QUANTA) and used == MLFQ_QUANTA[level]:
+                    levels[current] = level + 1
+                    queues[level + 1].append(current)
+                    current = None
+                elif level and arrived:
+                    queues[level].append(current)
+                    current = None
+            elif algorithm in ("SRTF", "PRIORITY"):
+                ready.append(current)
+                current = None
+        if current is None:
+            used = 0
+            if algorithm == "MLFQ":
+                nonempty = [queue for queue in queues if queue]
+                current = nonempty[0].pop(0) if nonempty else None
+            elif ready:
+                key = {
+                    "FCFS": lambda i: (jobs[i].arrival, i),
+                    "SJF": lambda i: (jobs[i].burst, jobs[i].arrival, i),
+                    "SRTF": lambda i: (remaining[i], jobs[i].arrival, i),
+                    "PRIORITY": lambda i: (jobs[i].priority, jobs[i].arrival, i),
+                    "RR": None,
+                }[algorithm]
+                current = ready.pop(0) if key is None else min(ready, key=key)
+                if key is not None:
+                    ready.remove(current)
+        if current is None:
+            timeline.append(IDLE)
+        else:
+            if start[current] is None:
+                start[current] = t
+            timeline.append(jobs[current].name)
+            remaining[current] -= 1
+            used += 1
+        t += 1
+    finish[current] = t
+    gantt = []
+    for time, name in enumerate(timeline):
+        if gantt and gantt[-1][0] == name:
+            gantt[-1][2] = time + 1
+        else:
+            gantt.append([name, time, time + 1])
+    return start, finish, gantt
+
+
+def random_job_set(rng):
+    n = rng.randint(1, 6)
+    return [
+        Job(f"P{i + 1}", rng.randint(0, 12), rng.randint(1, 8), rng.randint(1, 3))
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "SJF", "SRTF", "PRIORITY", "RR", "MLFQ"])
+def test_matches_brute_force(algorithm):
+    rng = random.Random(algorithm)
+    for _ in range(2000):
+        jobs = random_job_set(rng)
+        quantum = rng.randint(1, 3)
+        schedule = simulate(algorithm, jobs, quantum)
+        start, finish, gantt = brute_force(algorithm, jobs, quantum)
+        assert (schedule.start, schedule.finish, schedule.gantt) == (start, finish, gantt), jobs
+
+
+def test_averages():
+    jobs = [Job("P1", 0, 5, 1), Job("P2", 1, 3, 1), Job("P3", 2, 1, 1)]
+    schedule = simulate("FCFS", jobs)
+    assert schedule.finish == [5, 8, 9]
+    assert schedule.averages() == ((0 + 4 + 6) / 3, (5 + 7 + 7) / 3)
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        simulate("LIFO", [Job("P1", 0, 1, 1)])
@@ -0,0 +1,121 @@
+import asyncio
+import http.client
+import json
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from qbank import metrics
+from qbank.service import COALESCE_MAX_COUNT, HTTPError, QuestionService, parse_params
+
+
+@pytest.fixture(scope="module")
+def service():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    service = QuestionService(workers=2)
+    server = asyncio.run_coroutine_threadsafe(
+        asyncio.start_server(service.handle_connection, "127.0.0.1", 0), loop
+    ).result()
+    service.port = server.sockets[0].getsockname()[1]
+    service.call = lambda coro: asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=60)
+    yield service
+    server.close()
+    service.call(server.wait_closed())
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    service.close()
+
+
+def request(service, method, path, payload=None):
+    conn = http.client.HTTPConnection("127.0.0.1", service.port, timeout=60)
+    try:
+        conn.request(method, path, body=None if payload is None else json.dumps(payload))
+        response = conn.getresponse()
+        return response.status, response.read()
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("params, message", [
+    ({"bank": "heap", "subtopic": "Introduction"}, "unknown bank"),
+    ({"subtopic": "Nope"}, "unknown subtopic"),
+    ({"subtopic": "Introduction", "level": "Level 9"}, "unknown level"),
+    ({"subtopic": "Introduction", "type": "Essay"}, "unknown question type"),
+    ({"subtopic": "Introduction", "count": "ten"}, "whole numbers"),
+    ({"subtopic": "Introduction", "count": -1}, "non-negative"),
+])
+def test_parse_params_rejects_bad_input(params, message):
+    with pytest.raises(HTTPError, match=message) as info:
+        parse_params(params)
+    assert info.value.status == 400
+
+
+def test_bad_requests_get_400_and_unknown_routes_404(service):
+    status, body = request(service, "GET", "/generate?subtopic=Nope")
+    assert status == 400 and "unknown subtopic" in json.loads(body)["error"]
+    assert request(service, "POST", "/generate", {"subtopic": "Introduction", "count": 5000})[0] == 400
+    assert request(service, "GET", "/nowhere")[0] == 404
+
+
+def test_metrics_route_is_404_while_disabled(service):
+    assert not metrics.enabled
+    assert request(service, "GET", "/metrics")[0] == 404
+
+
+def test_exhausted_question_space_is_409(service):
+    # Types of Queues / Level 1 has only 10 distinct long-answer questions.
+    status, body = request(service, "POST", "/generate", {
+        "bank": "queue", "subtopic": "Types of Queues", "count": 11,
+    })
+    assert status == 409 and "10 distinct" in json.loads(body)["error"]
+
+
+def test_generate_returns_count_questions(service):
+    status, body = request(service, "POST", "/generate", {"subtopic": "Operations", "count": 7, "seed": 3})
+    questions = json.loads(body)["questions"]
+    assert status == 200 and len(questions) == 7
+    assert all(q["subtopic"] == "Operations" and q["seed"] == 3 for q in questions)
+
+
+def test_concurrent_small_requests_share_one_pool_job(service):
+    key = ("stack", "Applications", "Level 1", "Long Answer", False)
+    jobs = []
+    run_job = service.run_job
+
+    async def counting_run_job(*args):
+        jobs.append(args)
+        return await run_job(*args)
+
+    async def burst():
+        return await asyncio.gather(*(service.generate(key, 4, None) for _ in range(6)))
+
+    service.run_job = counting_run_job
+    try:
+        results = service.call(burst())
+        seeded = service.call(service.generate(key, 4, 11))
+        oversized = service.call(service.generate(key, COALESCE_MAX_COUNT + 1, None))
+    finally:
+        del service.run_job
+    assert [len(lines) for lines in results] == [4] * 6
+    # One job served the whole burst, so its questions never repeat across requests.
+    questions = [json.loads(line)["question"] for lines in results for line in lines]
+    assert len(set(questions)) == 24
+    assert len(seeded) == 4 and len(oversized) == COALESCE_MAX_COUNT + 1
+    assert [args[1] for args in jobs] == [24, 4, COALESCE_MAX_COUNT + 1]
+
+
+def test_bulk_generate_matches_the_cli_byte_for_byte(service):
+    args = {"bank": "queue", "subtopic": "Queue Numericals", "level": "Level 2", "count": 11000, "seed": 7}
+    status, body = request(service, "POST", "/bulk-generate", args)
+    cli = subprocess.run(
+        [sys.executable, "-m", "qbank", "--bank", "queue", "--subtopic", "Queue Numericals",
+         "--level", "Level 2", "--count", "11000", "--seed", "7", "--workers", "2"],
+        capture_output=True, check=True,
+    ).stdout
+    assert status == 200 and body == cli
+    # 11000 questions span three shards.
+    assert len(body.splitlines()) == 11000
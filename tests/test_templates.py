@@ -0,0 +1,53 @@
+import random
+
+import pytest
+
+from qbank import stacks
+from qbank.errors import CapacityError
+from qbank.templates import IndexPermutation, compile_template, iter_template_questions
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 1000, IndexPermutation.SHUFFLE_LIMIT + 1])
+def test_index_permutation_is_a_permutation(size):
+    order = list(IndexPermutation(size, random.Random(size)))
+    assert sorted(order) == list(range(size))
+
+
+def test_index_permutation_depends_on_rng():
+    size = IndexPermutation.SHUFFLE_LIMIT * 3
+    first = list(IndexPermutation(size, random.Random(1)))[:50]
+    assert first == list(IndexPermutation(size, random.Random(1)))[:50]
+    assert first != list(IndexPermutation(size, random.Random(2)))[:50]
+
+
+def test_fill_index_enumerates_distinct_fillings():
+    template = compile_template("{option1} {option2} {item}", {"operation": ["a", "b", "c"], "item": ["x", "y"]})
+    assert template.size == 3 * 2 * 2
+    fillings = {template.fill_index(i) for i in range(template.size)}
+    assert len(fillings) == template.size
+    assert "a a x" not in fillings
+
+
+def test_whole_space_without_repeats():
+    size = stacks.compiled_template_bank["Operations"]["Level 2"].size
+    questions = [q["question"] for q in iter_template_questions(
+        stacks.compiled_template_bank, "Operations", "Level 2", size, rng=random.Random(4)
+    )]
+    assert len(set(questions)) == size
+
+
+def test_oversized_request_fails_before_yielding():
+    size = stacks.compiled_template_bank["Operations"]["Level 2"].size
+    questions = iter_template_questions(stacks.compiled_template_bank, "Operations", "Level 2", size + 1)
+    with pytest.raises(CapacityError):
+        next(questions)
+
+
+def test_used_questions_exhaust_the_space():
+    size = stacks.compiled_template_bank["Operations"]["Level 2"].size
+    used = set()
+    list(iter_template_questions(stacks.compiled_template_bank, "Operations", "Level 2", size - 5, used))
+    rest = list(iter_template_questions(stacks.compiled_template_bank, "Operations", "Level 2", 5, used))
+    assert len(used) == size and len(rest) == 5
+    with pytest.raises(CapacityError):
+        list(iter_template_questions(stacks.compiled_template_bank, "Operations", "Level 2", 1, used))
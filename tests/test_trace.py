@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from qbank.trace import KEYFRAME_MIN_DELTAS, DeltaTrace, display_list
+
+
+def random_run(rng, steps, initial):
+    """A random traced run and the full state after every step."""
+    state = list(initial)
+    trace = DeltaTrace(state)
+    snapshots = []
+    for i in range(steps):
+        for _ in range(rng.randint(0, 3)):
+            op = rng.randrange(5)
+            if op == 0 or not state:
+                state.append(i)
+                trace.push(i)
+            elif op == 1:
+                trace.pop(state.pop())
+            elif op == 2:
+                state.insert(0, -i)
+                trace.pushleft(-i)
+            elif op == 3:
+                trace.popleft(state.pop(0))
+            else:
+                index = rng.randrange(len(state))
+                trace.set(index, i * 10, state[index])
+                state[index] = i * 10
+        trace.step(i, state)
+        snapshots.append(list(state))
+    return trace, snapshots
+
+
+@pytest.mark.parametrize("initial_size", [0, 5, 200])
+def test_replay_and_state_at_match_full_snapshots(initial_size):
+    rng = random.Random(initial_size)
+    initial = list(range(initial_size))
+    trace, snapshots = random_run(rng, 2000, initial)
+    assert trace.keyframes
+    assert [(note, list(state)) for note, _, state in trace.replay()] == list(enumerate(snapshots))
+    assert trace.state_at(-1) == initial
+    for step in rng.sample(range(len(snapshots)), 200):
+        assert trace.state_at(step) == snapshots[step]
+        assert [list(state) for _, _, state in trace.replay(step)][0] == snapshots[step]
+
+
+def test_keyframes_stay_within_the_delta_count():
+    trace, _ = random_run(random.Random(1), 5000, range(50))
+    assert len(trace.keyframes) * KEYFRAME_MIN_DELTAS <= len(trace.deltas)
+
+
+def test_state_at_out_of_range():
+    trace = DeltaTrace()
+    trace.step()
+    with pytest.raises(IndexError):
+        trace.state_at(1)
+
+
+def test_display_list_elides_long_states():
+    assert display_list([1, 2]) == "[1, 2]"
+    text = display_list(list(range(100)))
+    assert text.startswith("[0, 1,") and "... 68 more ..." in text and text.endswith("98, 99]")